@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -10,6 +12,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pybyd import BydClient
 
 from .const import (
@@ -35,8 +38,14 @@ from .const import (
     MIN_POLL_INTERVAL,
     PLATFORMS,
 )
-from .coordinator import BydApi, BydDataUpdateCoordinator, BydGpsUpdateCoordinator
+from .coordinator import (
+    BydApi,
+    BydDataUpdateCoordinator,
+    BydGpsUpdateCoordinator,
+    forget_config,
+)
 from .device_fingerprint import async_generate_device_profile
+from .snapshot import BydSnapshot, async_remove_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,23 +59,41 @@ def _sanitize_interval(value: int, default: int, min_value: int, max_value: int)
     return max(min_value, min(max_value, parsed))
 
 
+async def _async_first_refresh(
+    coordinators: Iterable[DataUpdateCoordinator[dict[str, Any]]],
+) -> None:
+    """Run first refreshes together and raise the first error once all settle.
+
+    Waiting for every refresh keeps none of them running against an API
+    that a failed setup is about to discard.
+    """
+    results = await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in coordinators
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up BYD Vehicle from a config entry."""
     _LOGGER.debug("Setting up BYD config entry %s", entry.entry_id)
     hass.data.setdefault(DOMAIN, {})
 
-    # Ensure a device fingerprint exists (backfill for pre-existing entries)
-    if CONF_DEVICE_PROFILE not in entry.data:
-        hass.config_entries.async_update_entry(
-            entry,
-            data={
-                **entry.data,
-                CONF_DEVICE_PROFILE: await async_generate_device_profile(hass),
-            },
-        )
+    # Ensure a device fingerprint exists (backfill for pre-existing entries).
+    # It is only persisted once the vehicle list has been fetched with it.
+    device_profile: dict[str, str] | None = entry.data.get(CONF_DEVICE_PROFILE)
+    if device_profile is None:
+        device_profile = await async_generate_device_profile(hass)
 
+    # HA's shared session already keeps connections alive and allows far
+    # more concurrent connections per host than telemetry + GPS per VIN need.
     session = async_get_clientsession(hass)
-    api = BydApi(hass, entry, session)
+    api = BydApi(hass, entry, session, device_profile=device_profile)
 
     poll_interval = _sanitize_interval(
         entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL),
@@ -101,6 +128,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not vehicles:
         raise ConfigEntryNotReady("No vehicles available for this account")
 
+    if CONF_DEVICE_PROFILE not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_DEVICE_PROFILE: device_profile},
+        )
+
     _LOGGER.debug(
         "Discovered %s BYD vehicle(s) for entry %s",
         len(vehicles),
@@ -137,13 +170,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # first refresh are dispatched to coordinators instead of being dropped.
     api.register_coordinators(coordinators)
 
+    # Vehicles restored from the last run's snapshot show their last-known
+    # state right away and are refreshed in the background after setup.
+    snapshot = BydSnapshot(hass, entry.entry_id, coordinators, gps_coordinators)
+    restored = await snapshot.async_restore()
+
     try:
         _LOGGER.debug("Running first refresh for BYD telemetry coordinators")
-        for coordinator in coordinators.values():
-            await coordinator.async_config_entry_first_refresh()
+        await _async_first_refresh(
+            coordinator
+            for vin, coordinator in coordinators.items()
+            if vin not in restored
+        )
+        # GPS runs after telemetry so smart polling sees the vehicle state.
         _LOGGER.debug("Running first refresh for BYD GPS coordinators")
-        for gps_coordinator in gps_coordinators.values():
-            await gps_coordinator.async_config_entry_first_refresh()
+        await _async_first_refresh(
+            gps_coordinator
+            for vin, gps_coordinator in gps_coordinators.items()
+            if vin not in restored
+        )
     except Exception as exc:  # noqa: BLE001
         raise ConfigEntryNotReady from exc
 
@@ -151,10 +196,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "api": api,
         "coordinators": coordinators,
         "gps_coordinators": gps_coordinators,
+        "snapshot": snapshot,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    for vin in restored:
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_restored(coordinators[vin], gps_coordinators[vin]),
+            f"{DOMAIN}_refresh_restored_{vin[-6:]}",
+        )
+    snapshot.async_track()
+
     # --- Register domain services (once, on first entry) ---
     _async_register_services(hass)
 
@@ -163,12 +217,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_refresh_restored(
+    coordinator: BydDataUpdateCoordinator, gps_coordinator: BydGpsUpdateCoordinator
+) -> None:
+    """Replace restored snapshot data with a live fetch."""
+    await coordinator.async_refresh()
+    await gps_coordinator.async_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading BYD config entry %s", entry.entry_id)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if entry_data:
+            # Flush the snapshot while the coordinators still hold data.
+            if "snapshot" in entry_data:
+                await entry_data["snapshot"].async_unload()
+            # Cancel pending refreshes and listeners before the client closes.
+            for coordinator in entry_data.get("coordinators", {}).values():
+                await coordinator.async_shutdown()
+            for gps_coordinator in entry_data.get("gps_coordinators", {}).values():
+                await gps_coordinator.async_shutdown()
         if entry_data and "api" in entry_data:
             await entry_data["api"].async_shutdown()
         _LOGGER.debug("Unloaded BYD config entry %s", entry.entry_id)
@@ -186,6 +257,12 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget cached state for a deleted config entry."""
+    forget_config(entry.entry_id)
+    await async_remove_snapshot(hass, entry.entry_id)
+
+
 # ------------------------------------------------------------------
 # Service helpers
 # ------------------------------------------------------------------
@@ -6,8 +6,11 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
+from itertools import product
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -27,7 +30,14 @@ from pybyd.models.realtime import (
 
 from .const import DOMAIN
 from .coordinator import BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
+
+#: Extraction kinds for ``BydBinarySensorDescription.extract_kind``.
+#: ``TRUTHY`` expects an ``attrgetter`` as ``extract_arg``; ``EQUALS``
+#: expects an ``(attrgetter, target)`` pair; ``CALLABLE`` uses ``value_fn``.
+_EXTRACT_CALLABLE = 0
+_EXTRACT_TRUTHY = 1
+_EXTRACT_EQUALS = 2
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -37,6 +47,8 @@ class BydBinarySensorDescription(BinarySensorEntityDescription):
     source: str = "realtime"
     attr_key: str | None = None
     value_fn: Callable[[Any], bool | None] | None = None
+    extract_kind: int = _EXTRACT_CALLABLE
+    extract_arg: Any = None
 
 
 def _as_charging_state(value: Any) -> ChargingState | None:
@@ -75,26 +87,16 @@ def _is_plug_connected_from_realtime(obj: Any) -> bool | None:
     return state in (ChargingState.CONNECTED, ChargingState.CHARGING)
 
 
-def _attr_truthy(attr_name: str) -> Callable[[Any], bool | None]:
-    """Return a value_fn that checks ``bool(getattr(obj, attr_name))``."""
-
-    def _fn(obj: Any) -> bool | None:
-        val = getattr(obj, attr_name, None)
-        if val is None:
-            return None
-        return bool(val)
-
-    return _fn
-
+def _attr_negated_truthy(attr_name: str) -> Callable[[Any], bool | None]:
+    """Return a value_fn that checks ``not getattr(obj, attr_name)``.
 
-def _attr_equals(attr_name: str, target: Any) -> Callable[[Any], bool | None]:
-    """Return a value_fn that checks ``getattr(obj, attr_name) == target``."""
+    ``None`` propagates as-is so unknown states stay unknown.
+    """
+    get = attrgetter(attr_name)
 
     def _fn(obj: Any) -> bool | None:
-        val = getattr(obj, attr_name, None)
-        if val is None:
-            return None
-        return val == target
+        value = get(obj)
+        return None if value is None else not value
 
     return _fn
 
@@ -139,13 +141,14 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BydBinarySensorDescription, ...] = (
         device_class=BinarySensorDeviceClass.LOCK,
         # is_locked returns True when locked; for BinarySensorDeviceClass.LOCK,
         # is_on=True means "problem" (unlocked), so invert. None propagates as-is.
-        value_fn=lambda r: None if (v := r.is_locked) is None else not v,
+        value_fn=_attr_negated_truthy("is_locked"),
     ),
     BydBinarySensorDescription(
         key="sentry_status",
         source="realtime",
         icon="mdi:shield-car",
-        value_fn=_attr_truthy("sentry_status"),
+        extract_kind=_EXTRACT_TRUTHY,
+        extract_arg=attrgetter("sentry_status"),
     ),
     # ====================================
     # Individual doors (disabled)
@@ -154,49 +157,56 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BydBinarySensorDescription, ...] = (
         key="left_front_door",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("left_front_door", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("left_front_door"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="right_front_door",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("right_front_door", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("right_front_door"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="left_rear_door",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("left_rear_door", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("left_rear_door"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="right_rear_door",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("right_rear_door", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("right_rear_door"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="trunk_lid",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("trunk_lid", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("trunk_lid"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="sliding_door",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("sliding_door", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("sliding_door"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="forehold",
         source="realtime",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=_attr_equals("forehold", DoorOpenState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("forehold"), DoorOpenState.OPEN),
         entity_registry_enabled_default=False,
     ),
     # ====================================
@@ -206,35 +216,40 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BydBinarySensorDescription, ...] = (
         key="left_front_window",
         source="realtime",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=_attr_equals("left_front_window", WindowState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("left_front_window"), WindowState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="right_front_window",
         source="realtime",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=_attr_equals("right_front_window", WindowState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("right_front_window"), WindowState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="left_rear_window",
         source="realtime",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=_attr_equals("left_rear_window", WindowState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("left_rear_window"), WindowState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="right_rear_window",
         source="realtime",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=_attr_equals("right_rear_window", WindowState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("right_rear_window"), WindowState.OPEN),
         entity_registry_enabled_default=False,
     ),
     BydBinarySensorDescription(
         key="skylight",
         source="realtime",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=_attr_equals("skylight", WindowState.OPEN),
+        extract_kind=_EXTRACT_EQUALS,
+        extract_arg=(attrgetter("skylight"), WindowState.OPEN),
         entity_registry_enabled_default=False,
     ),
     # ====================================
@@ -246,7 +261,8 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BydBinarySensorDescription, ...] = (
         icon="mdi:heat-wave",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_attr_truthy("battery_heat_state"),
+        extract_kind=_EXTRACT_TRUTHY,
+        extract_arg=attrgetter("battery_heat_state"),
     ),
     BydBinarySensorDescription(
         key="charge_heat_state",
@@ -254,7 +270,8 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BydBinarySensorDescription, ...] = (
         icon="mdi:heat-wave",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_attr_truthy("charge_heat_state"),
+        extract_kind=_EXTRACT_TRUTHY,
+        extract_arg=attrgetter("charge_heat_state"),
     ),
     BydBinarySensorDescription(
         key="vehicle_state",
@@ -266,6 +283,63 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[BydBinarySensorDescription, ...] = (
     ),
 )
 
+#: Unique-id tail (``_<source>_<key>``) per description key, built once at import.
+_UID_TAIL: dict[str, str] = {
+    description.key: f"_{description.source}_{description.key}"
+    for description in BINARY_SENSOR_DESCRIPTIONS
+}
+
+
+def _extract_plan_entry(
+    description: BydBinarySensorDescription,
+) -> tuple[str, int, Any]:
+    """Return the ``(key, extract_kind, extract_arg)`` triple for a description.
+
+    Descriptions without an explicit kind or ``value_fn`` fall back to a
+    truthy check on ``attr_key`` (or ``key``).
+    """
+    if description.extract_kind != _EXTRACT_CALLABLE:
+        return description.key, description.extract_kind, description.extract_arg
+    if description.value_fn is not None:
+        return description.key, _EXTRACT_CALLABLE, description.value_fn
+    getter = attrgetter(description.attr_key or description.key)
+    return description.key, _EXTRACT_TRUTHY, getter
+
+
+_EXTRACT_PLAN: tuple[tuple[str, int, Any], ...] = tuple(
+    _extract_plan_entry(description) for description in BINARY_SENSOR_DESCRIPTIONS
+)
+
+
+def _resolve_snapshot(realtime: Any) -> dict[str, bool | None]:
+    """Resolve every binary sensor value in a single pass over *realtime*."""
+    if realtime is None:
+        return {}
+    snapshot: dict[str, bool | None] = {}
+    for key, kind, arg in _EXTRACT_PLAN:
+        value: Any
+        if kind == _EXTRACT_CALLABLE:
+            # value_fn errors are bugs; let them surface.
+            value = arg(realtime)
+        elif kind == _EXTRACT_EQUALS:
+            getter, target = arg
+            try:
+                value = getter(realtime)
+            except AttributeError:
+                value = None
+            if value is not None:
+                value = value == target
+        else:
+            try:
+                value = arg(realtime)
+            except AttributeError:
+                value = None
+            # Most realtime flags are already bool; only coerce the rest.
+            if value is not None and type(value) is not bool:
+                value = bool(value)
+        snapshot[key] = value
+    return snapshot
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -276,13 +350,22 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinators: dict[str, BydDataUpdateCoordinator] = data["coordinators"]
 
-    entities: list[BinarySensorEntity] = []
-    for vin, coordinator in coordinators.items():
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
-        if vehicle is None:
-            continue
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            entities.append(BydBinarySensor(coordinator, vin, vehicle, description))
+    for coordinator in coordinators.values():
+        coordinator.set_binary_sensor_resolver(_resolve_snapshot)
+
+    vehicles = [
+        (vin, coordinator, vehicle)
+        for vin, coordinator in coordinators.items()
+        if (vehicle := get_coordinator_vehicle(coordinator, vin)) is not None
+    ]
+    # Sensors without data are still registered, disabled by default, so
+    # users can enable them and they pick up values the car reports later.
+    entities: list[BinarySensorEntity] = [
+        BydBinarySensor(coordinator, vin, vehicle, description)
+        for (vin, coordinator, vehicle), description in product(
+            vehicles, BINARY_SENSOR_DESCRIPTIONS
+        )
+    ]
 
     async_add_entities(entities)
 
@@ -306,34 +389,29 @@ class BydBinarySensor(BydVehicleEntity, BinarySensorEntity):
         self._attr_translation_key = description.key
         self._vin = vin
         self._vehicle = vehicle
-        self._attr_unique_id = f"{vin}_{description.source}_{description.key}"
+        self._attr_unique_id = sys.intern(vin + _UID_TAIL[description.key])
+        self._key = description.key
         self._last_is_on: bool | None = None
+        self._has_source = False
+        self._cached_value: bool | None = None
+        self._refresh_cache()
 
         # Auto-disable binary sensors that return no data on first fetch.
         if description.entity_registry_enabled_default is not False:
-            if self._resolve_value() is None:
+            if self._cached_value is None:
                 self._attr_entity_registry_enabled_default = False
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def _get_source_obj(self, source: str = "") -> Any | None:
-        """Return the model object for this sensor's source."""
-        return super()._get_source_obj(source or self.entity_description.source)
-
-    def _resolve_value(self) -> bool | None:
-        """Extract the current value using the description's extraction logic."""
-        obj = self._get_source_obj()
-        if obj is None:
-            return None
-        if self.entity_description.value_fn is not None:
-            return self.entity_description.value_fn(obj)
-        attr = self.entity_description.attr_key or self.entity_description.key
-        value = getattr(obj, attr, None)
-        if value is None:
-            return None
-        return bool(value)
+    def _refresh_cache(self) -> None:
+        """Read this sensor's value from the coordinator-level snapshot."""
+        snapshot = self.coordinator.binary_sensor_snapshot
+        self._has_source = self._key in snapshot
+        self._cached_value = snapshot.get(self._key)
+        if self._cached_value is not None:
+            self._last_is_on = self._cached_value
 
     # ------------------------------------------------------------------
     # Entity properties
@@ -342,19 +420,19 @@ class BydBinarySensor(BydVehicleEntity, BinarySensorEntity):
     @property
     def available(self) -> bool:
         """Return True when the coordinator has data for this source."""
-        return super().available and self._get_source_obj() is not None
+        return super().available and self._has_source
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state, preserving last known when unavailable."""
-        value = self._resolve_value()
-        if value is not None:
-            return value
+        if self._cached_value is not None:
+            return self._cached_value
         return self._last_is_on
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on)
+
     def _handle_coordinator_update(self) -> None:
-        """Track last known state, then run standard coordinator update."""
-        value = self._resolve_value()
-        if value is not None:
-            self._last_is_on = value
+        """Refresh the cached value, then write state if it changed."""
+        self._refresh_cache()
         super()._handle_coordinator_update()
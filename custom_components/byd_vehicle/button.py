@@ -20,7 +20,7 @@ from pybyd import BydRemoteControlError
 
 from .const import DOMAIN
 from .coordinator import BydApi, BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,7 +65,7 @@ async def async_setup_entry(
     entities: list[ButtonEntity] = []
     for vin, coordinator in coordinators.items():
         gps_coordinator = gps_coordinators.get(vin)
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(coordinator, vin)
         if vehicle is None:
             continue
 
@@ -99,13 +99,6 @@ class BydButton(BydVehicleEntity, ButtonEntity):
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_button_{description.key}"
 
-    @property
-    def available(self) -> bool:
-        """Available when coordinator has data for this vehicle."""
-        if not super().available:
-            return False
-        return self.coordinator.data.get("vehicles", {}).get(self._vin) is not None
-
     async def async_press(self) -> None:
         """Execute the remote command."""
         method_name = self.entity_description.method
@@ -151,12 +144,6 @@ class BydForcePollButton(BydVehicleEntity, ButtonEntity):
         self._gps_coordinator = gps_coordinator
         self._attr_unique_id = f"{vin}_button_force_poll"
 
-    @property
-    def available(self) -> bool:
-        if not super().available:
-            return False
-        return self.coordinator.data.get("vehicles", {}).get(self._vin) is not None
-
     async def async_press(self) -> None:
         """Force-refresh all coordinators for this vehicle."""
         try:
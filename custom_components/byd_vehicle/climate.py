@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+from operator import methodcaller
 from typing import Any
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
@@ -21,7 +21,7 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import BydApi, BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 
 
 async def async_setup_entry(
@@ -41,7 +41,7 @@ async def async_setup_entry(
     entities: list[ClimateEntity] = []
 
     for vin, coordinator in coordinators.items():
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(coordinator, vin)
         if vehicle is None:
             continue
         entities.append(BydClimate(coordinator, api, vin, vehicle, climate_duration))
@@ -171,10 +171,11 @@ class BydClimate(BydVehicleEntity, ClimateEntity):
             self._pending_target_temp or self.target_temperature or self._DEFAULT_TEMP_C
         )
 
-        async def _call(client: Any) -> Any:
-            if hvac_mode == HVACMode.OFF:
-                return await client.stop_climate(self._vin)
-            return await client.start_climate(
+        if hvac_mode == HVACMode.OFF:
+            call = methodcaller("stop_climate", self._vin)
+        else:
+            call = methodcaller(
+                "start_climate",
                 self._vin,
                 params=ClimateStartParams(
                     temperature=temp,
@@ -186,7 +187,7 @@ class BydClimate(BydVehicleEntity, ClimateEntity):
             "stop_climate" if hvac_mode == HVACMode.OFF else "start_climate"
         )
         self._last_mode = hvac_mode
-        await self._execute_command(self._api, _call, command=self._last_command)
+        await self._execute_command(self._api, call, command=self._last_command)
 
         # Optimistic coordinator-level HVAC update so that *all* entities
         # (A/C switch, seats, etc.) see the new state immediately.
@@ -215,18 +216,17 @@ class BydClimate(BydVehicleEntity, ClimateEntity):
 
         # If climate is currently on, send the update immediately
         if self.hvac_mode != HVACMode.OFF:
-
-            async def _call(client: Any) -> Any:
-                return await client.start_climate(
-                    self._vin,
-                    params=ClimateStartParams(
-                        temperature=clamped,
-                        time_span=self._climate_duration_code,
-                    ),
-                )
+            call = methodcaller(
+                "start_climate",
+                self._vin,
+                params=ClimateStartParams(
+                    temperature=clamped,
+                    time_span=self._climate_duration_code,
+                ),
+            )
 
             self._last_command = "start_climate"
-            await self._execute_command(self._api, _call, command=self._last_command)
+            await self._execute_command(self._api, call, command=self._last_command)
             return
 
         self._command_pending = True
@@ -255,18 +255,18 @@ class BydClimate(BydVehicleEntity, ClimateEntity):
         )
         self._pending_target_temp = temp_c
 
-        async def _call(client: Any) -> Any:
-            return await client.start_climate(
-                self._vin,
-                params=ClimateStartParams(
-                    temperature=temp_c,
-                    time_span=self._climate_duration_code,
-                ),
-            )
+        call = methodcaller(
+            "start_climate",
+            self._vin,
+            params=ClimateStartParams(
+                temperature=temp_c,
+                time_span=self._climate_duration_code,
+            ),
+        )
 
         self._last_command = "start_climate"
         self._last_mode = HVACMode.HEAT_COOL
-        await self._execute_command(self._api, _call, command=self._last_command)
+        await self._execute_command(self._api, call, command=self._last_command)
 
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic state when fresh data arrives from the coordinator."""
@@ -290,17 +290,6 @@ class BydClimate(BydVehicleEntity, ClimateEntity):
             return False
         return True
 
-    _DELAYED_REFRESH_SECONDS = 20
-
-    def _schedule_delayed_refresh(self) -> None:
-        """Schedule a coordinator refresh after a short delay."""
-
-        async def _delayed() -> None:
-            await asyncio.sleep(self._DELAYED_REFRESH_SECONDS)
-            await self.coordinator.async_force_refresh()
-
-        self.hass.async_create_task(_delayed())
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional HVAC attributes."""
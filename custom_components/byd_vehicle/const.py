@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from homeassistant.const import Platform
 from pybyd import VALID_CLIMATE_DURATIONS
 
@@ -54,62 +57,66 @@ MIN_GPS_INACTIVE_INTERVAL = 60
 MAX_GPS_INACTIVE_INTERVAL = 3600
 
 # https://github.com/jkaberg/hass-byd-vehicle/issues/12
-BASE_URLS: dict[str, str] = {
-    "Europe": "https://dilinkappoversea-eu.byd.auto",
-    "Singapore/APAC": "https://dilinkappoversea-sg.byd.auto",
-    "Australia": "https://dilinkappoversea-au.byd.auto",
-    "Brazil": "https://dilinkappoversea-br.byd.auto",
-    "Japan": "https://dilinkappoversea-jp.byd.auto",
-    "Uzbekistan": "https://dilinkappoversea-uz.byd.auto",
-    "Middle East/Africa": "https://dilinkappoversea-no.byd.auto",
-    "Mexico/Latin America": "https://dilinkappoversea-mx.byd.auto",
-    "Indonesia": "https://dilinkappoversea-id.byd.auto",
-    "Turkey": "https://dilinkappoversea-tr.byd.auto",
-    "Korea": "https://dilinkappoversea-kr.byd.auto",
-    "India": "https://dilinkappoversea-in.byd.auto",
-    "Vietnam": "https://dilinkappoversea-vn.byd.auto",
-    "Saudi Arabia": "https://dilinkappoversea-sa.byd.auto",
-    "Oman": "https://dilinkappoversea-om.byd.auto",
-    "Kazakhstan": "https://dilinkappoversea-kz.byd.auto",
-}
+BASE_URLS: Mapping[str, str] = MappingProxyType(
+    {
+        "Europe": "https://dilinkappoversea-eu.byd.auto",
+        "Singapore/APAC": "https://dilinkappoversea-sg.byd.auto",
+        "Australia": "https://dilinkappoversea-au.byd.auto",
+        "Brazil": "https://dilinkappoversea-br.byd.auto",
+        "Japan": "https://dilinkappoversea-jp.byd.auto",
+        "Uzbekistan": "https://dilinkappoversea-uz.byd.auto",
+        "Middle East/Africa": "https://dilinkappoversea-no.byd.auto",
+        "Mexico/Latin America": "https://dilinkappoversea-mx.byd.auto",
+        "Indonesia": "https://dilinkappoversea-id.byd.auto",
+        "Turkey": "https://dilinkappoversea-tr.byd.auto",
+        "Korea": "https://dilinkappoversea-kr.byd.auto",
+        "India": "https://dilinkappoversea-in.byd.auto",
+        "Vietnam": "https://dilinkappoversea-vn.byd.auto",
+        "Saudi Arabia": "https://dilinkappoversea-sa.byd.auto",
+        "Oman": "https://dilinkappoversea-om.byd.auto",
+        "Kazakhstan": "https://dilinkappoversea-kz.byd.auto",
+    }
+)
 
-COUNTRY_OPTIONS: dict[str, tuple[str, str]] = {
-    "Argentina": ("AR", "es"),
-    "Australia": ("AU", "en"),
-    "Austria": ("AT", "de"),
-    "Belgium": ("BE", "en"),
-    "Brazil": ("BR", "pt"),
-    "Colombia": ("CO", "es"),
-    "Costa Rica": ("CR", "es"),
-    "Czech Republic": ("CZ", "cs"),
-    "Denmark": ("DK", "da"),
-    "El Salvador": ("SV", "es"),
-    "Finland": ("FI", "fi"),
-    "France": ("FR", "fr"),
-    "Germany": ("DE", "de"),
-    "Hong Kong": ("HK", "zh"),
-    "Hungary": ("HU", "hu"),
-    "Ireland": ("IE", "en"),
-    "India": ("IN", "en"),
-    "Indonesia": ("ID", "id"),
-    "Italy": ("IT", "it"),
-    "Japan": ("JP", "ja"),
-    "Kazakhstan": ("KZ", "kk"),
-    "Malaysia": ("MY", "ms"),
-    "Mexico": ("MX", "es"),
-    "Netherlands": ("NL", "nl"),
-    "New Zealand": ("NZ", "en"),
-    "Norway": ("NO", "no"),
-    "Pakistan": ("PK", "en"),
-    "Philippines": ("PH", "en"),
-    "Poland": ("PL", "pl"),
-    "South Africa": ("ZA", "en"),
-    "South Korea": ("KR", "ko"),
-    "Spain": ("ES", "es"),
-    "Sweden": ("SE", "sv"),
-    "Thailand": ("TH", "th"),
-    "Turkey": ("TR", "tr"),
-    "United Kingdom": ("GB", "en"),
-    "Uzbekistan": ("UZ", "uz"),
-    "Portugal": ("PT", "pt"),
-}
+COUNTRY_OPTIONS: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "Argentina": ("AR", "es"),
+        "Australia": ("AU", "en"),
+        "Austria": ("AT", "de"),
+        "Belgium": ("BE", "en"),
+        "Brazil": ("BR", "pt"),
+        "Colombia": ("CO", "es"),
+        "Costa Rica": ("CR", "es"),
+        "Czech Republic": ("CZ", "cs"),
+        "Denmark": ("DK", "da"),
+        "El Salvador": ("SV", "es"),
+        "Finland": ("FI", "fi"),
+        "France": ("FR", "fr"),
+        "Germany": ("DE", "de"),
+        "Hong Kong": ("HK", "zh"),
+        "Hungary": ("HU", "hu"),
+        "Ireland": ("IE", "en"),
+        "India": ("IN", "en"),
+        "Indonesia": ("ID", "id"),
+        "Italy": ("IT", "it"),
+        "Japan": ("JP", "ja"),
+        "Kazakhstan": ("KZ", "kk"),
+        "Malaysia": ("MY", "ms"),
+        "Mexico": ("MX", "es"),
+        "Netherlands": ("NL", "nl"),
+        "New Zealand": ("NZ", "en"),
+        "Norway": ("NO", "no"),
+        "Pakistan": ("PK", "en"),
+        "Philippines": ("PH", "en"),
+        "Poland": ("PL", "pl"),
+        "South Africa": ("ZA", "en"),
+        "South Korea": ("KR", "ko"),
+        "Spain": ("ES", "es"),
+        "Sweden": ("SE", "sv"),
+        "Thailand": ("TH", "th"),
+        "Turkey": ("TR", "tr"),
+        "United Kingdom": ("GB", "en"),
+        "Uzbekistan": ("UZ", "uz"),
+        "Portugal": ("PT", "pt"),
+    }
+)
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from datetime import UTC, datetime, timedelta
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from itertools import count
 from pathlib import Path
-from time import monotonic, perf_counter
-from typing import Any
+from time import gmtime, monotonic, perf_counter_ns, strftime, time, time_ns
+from typing import Any, TypeVar
 
+import orjson
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from pybyd import (
     BydApiError,
@@ -25,6 +28,7 @@ from pybyd import (
     BydTransportError,
 )
 from pybyd.config import BydConfig, DeviceProfile
+from pybyd.models.control import SeatClimateParams
 from pybyd.models.gps import GpsInfo
 from pybyd.models.hvac import HvacOverallStatus, HvacStatus
 from pybyd.models.realtime import (
@@ -49,6 +53,8 @@ from .value_guard import guard_gps_coordinates
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 #: Seconds to wait after an MQTT remoteControl ack before fetching HVAC
 #: state from the API.  Gives the BYD cloud time to propagate.
 _MQTT_HVAC_FETCH_DELAY_S: float = 3.0
@@ -71,7 +77,62 @@ _SEAT_HVAC_FIELDS: tuple[str, ...] = (
     "rr_seat_ventilation_state",
 )
 _STEERING_WHEEL_FIELD: str = "steering_wheel_heat_state"
+#: Seat states that count as "not active" for the optimistic reset.
+_INACTIVE_SEAT_STATES: frozenset[SeatHeatVentState] = frozenset(
+    {SeatHeatVentState.OFF, SeatHeatVentState.NO_DATA}
+)
+
+
+def _dump_default(value: Any) -> Any:
+    """Serialize pydantic models for debug dumps; stringify anything else."""
+    model_dump = getattr(value, "model_dump", None)
+    if model_dump is not None:
+        return model_dump(mode="json")
+    return str(value)
+
+
+def _format_failures(failures: dict[str, BaseException]) -> dict[str, str]:
+    """Render endpoint failures as ``{endpoint: "ErrorType: message"}``."""
+    return {
+        endpoint: f"{type(exc).__name__}: {exc}" for endpoint, exc in failures.items()
+    }
+
+
+def _active_seat_mask(hvac: HvacStatus) -> int:
+    """Return a bitmask of ``_SEAT_HVAC_FIELDS`` entries that are active."""
+    mask = 0
+    for bit, field in enumerate(_SEAT_HVAC_FIELDS):
+        val = getattr(hvac, field, None)
+        if val is not None and val not in _INACTIVE_SEAT_STATES:
+            mask |= 1 << bit
+    return mask
+
 
+def lookup_vin_data(data: dict[str, Any] | None, section: str, vin: str) -> Any:
+    """Return ``data[section][vin]``, or None when any level is missing."""
+    try:
+        return data[section][vin]  # type: ignore[index]
+    except (KeyError, TypeError):
+        return None
+
+
+#: Consecutive debug-dump write failures before dumps are switched off
+#: until the next reload (e.g. read-only or full storage).
+_MAX_DEBUG_DUMP_FAILURES: int = 5
+
+#: Debug dumps older than this are removed whenever the hourly file rolls over.
+_DEBUG_DUMP_RETENTION_S: float = 7 * 24 * 3600
+
+_NS_PER_HOUR = 3600 * 1_000_000_000
+
+#: Pending debug dumps held for the writer task; extra dumps are dropped.
+_DEBUG_DUMP_QUEUE_SIZE: int = 128
+
+#: Seconds the writer waits after the first queued dump before flushing.
+_DEBUG_DUMP_FLUSH_DELAY_S: float = 1.0
+
+#: (category, enqueue time in epoch ns, payload) waiting for the dump writer.
+_QueuedDump = tuple[str, int, dict[str, Any]]
 
 # Error tuples shared by telemetry and GPS _fetch closures.
 _AUTH_ERRORS = (BydAuthenticationError, BydSessionExpiredError)
@@ -82,25 +143,70 @@ _RECOVERABLE_ERRORS = (
     BydEndpointNotSupportedError,
 )
 
+#: Resolves every binary sensor value for one realtime model, keyed by
+#: description key.
+BinarySensorResolver = Callable[[Any], dict[str, bool | None]]
+
+
+#: Last BydConfig built per config entry, with the inputs it was built from.
+_CONFIG_CACHE: dict[str, tuple[tuple[Any, ...], BydConfig]] = {}
+
+
+def _get_config(
+    entry: ConfigEntry, device_profile: dict[str, str], time_zone: str
+) -> BydConfig:
+    """Return the client config for *entry*, reusing it across plain reloads."""
+    data = entry.data
+    key = (
+        data["username"],
+        data["password"],
+        data[CONF_BASE_URL],
+        data.get(CONF_COUNTRY_CODE, "NL"),
+        data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
+        data.get(CONF_CONTROL_PIN) or None,
+        time_zone,
+        tuple(sorted(device_profile.items())),
+    )
+    cached = _CONFIG_CACHE.get(entry.entry_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    config = BydConfig(
+        username=key[0],
+        password=key[1],
+        base_url=key[2],
+        country_code=key[3],
+        language=key[4],
+        time_zone=time_zone,
+        device=DeviceProfile(**device_profile),
+        control_pin=key[5],
+    )
+    _CONFIG_CACHE[entry.entry_id] = (key, config)
+    return config
+
+
+def forget_config(entry_id: str) -> None:
+    """Drop the cached client config for a removed config entry."""
+    _CONFIG_CACHE.pop(entry_id, None)
+
 
 class BydApi:
     """Thin wrapper around the pybyd client."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, session: Any) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        session: Any,
+        *,
+        device_profile: dict[str, str] | None = None,
+    ) -> None:
         self._hass = hass
         self._entry = entry
         self._http_session = session
-        time_zone = hass.config.time_zone or "UTC"
-        device = DeviceProfile(**entry.data[CONF_DEVICE_PROFILE])
-        self._config = BydConfig(
-            username=entry.data["username"],
-            password=entry.data["password"],
-            base_url=entry.data[CONF_BASE_URL],
-            country_code=entry.data.get(CONF_COUNTRY_CODE, "NL"),
-            language=entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
-            time_zone=time_zone,
-            device=device,
-            control_pin=entry.data.get(CONF_CONTROL_PIN) or None,
+        self._config = _get_config(
+            entry,
+            device_profile or entry.data[CONF_DEVICE_PROFILE],
+            hass.config.time_zone or "UTC",
         )
         self._client: BydClient | None = None
         self._debug_dumps_enabled = entry.options.get(
@@ -108,7 +214,18 @@ class BydApi:
             DEFAULT_DEBUG_DUMPS,
         )
         self._debug_dump_dir = Path(hass.config.path(".storage/byd_vehicle_debug"))
+        self._debug_dir_ready = False
+        self._dump_seq = count()
+        self._dump_hour: tuple[int, str] = (-1, "")
+        self._dump_failures = 0
+        self._dump_queue: asyncio.Queue[_QueuedDump | None] = asyncio.Queue(
+            maxsize=_DEBUG_DUMP_QUEUE_SIZE
+        )
+        self._dump_writer: asyncio.Task[None] | None = None
         self._coordinators: dict[str, BydDataUpdateCoordinator] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task[Any]] = {}
+        self._single_vin: str | None = None
+        self._single_coordinator: BydDataUpdateCoordinator | None = None
         _LOGGER.debug(
             "BYD API initialized: entry_id=%s, region=%s, language=%s",
             entry.entry_id,
@@ -121,31 +238,109 @@ class BydApi:
     ) -> None:
         """Register telemetry coordinators for MQTT push dispatch."""
         self._coordinators = coordinators
+        # Most accounts have one vehicle; let MQTT dispatch skip the dict.
+        if len(coordinators) == 1:
+            ((self._single_vin, self._single_coordinator),) = coordinators.items()
+        else:
+            self._single_vin, self._single_coordinator = None, None
 
-    def _write_debug_dump(self, category: str, payload: dict[str, Any]) -> None:
+    def _write_debug_batch(self, batch: list[_QueuedDump]) -> None:
+        """Append *batch* to the dump files, opening each file once."""
         if not self._debug_dumps_enabled:
             return
         try:
-            self._debug_dump_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S%fZ")
-            file_path = self._debug_dump_dir / f"{timestamp}_{category}.json"
-            file_path.write_text(
-                json.dumps(payload, ensure_ascii=False, indent=2, default=str),
-                encoding="utf-8",
-            )
+            if not self._debug_dir_ready:
+                self._debug_dump_dir.mkdir(parents=True, exist_ok=True)
+                self._debug_dir_ready = True
+            # One append-only JSONL file per hour and category; the
+            # sequence number orders records written in the same tick.
+            now_ns = time_ns()
+            hour = now_ns // _NS_PER_HOUR
+            cached_hour, label = self._dump_hour
+            if hour != cached_hour:
+                label = strftime("%Y%m%dT%H", gmtime(hour * 3600))
+                self._dump_hour = (hour, label)
+                # Also runs on the first write after a (re)load.
+                self._prune_debug_dumps()
+            lines: dict[str, list[bytes]] = {}
+            for category, queued_ns, payload in batch:
+                record = {"ts_ns": queued_ns, "seq": next(self._dump_seq), **payload}
+                lines.setdefault(category, []).append(
+                    orjson.dumps(
+                        record, option=orjson.OPT_NON_STR_KEYS, default=_dump_default
+                    )
+                )
+            for category, chunk in lines.items():
+                file_path = self._debug_dump_dir / f"{label}_{category}.jsonl"
+                with file_path.open("ab") as dump_file:
+                    dump_file.write(b"\n".join(chunk) + b"\n")
         except Exception:  # noqa: BLE001
-            _LOGGER.debug("Failed to write BYD debug dump.", exc_info=True)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Failed to write BYD debug dump.", exc_info=True)
+            self._dump_failures += 1
+            if self._dump_failures >= _MAX_DEBUG_DUMP_FAILURES:
+                self._debug_dumps_enabled = False
+                _LOGGER.warning(
+                    "Disabling BYD debug dumps after %s consecutive write failures",
+                    self._dump_failures,
+                )
+        else:
+            self._dump_failures = 0
 
-    async def _async_write_debug_dump(
-        self,
-        category: str,
-        payload: dict[str, Any],
-    ) -> None:
-        await self._hass.async_add_executor_job(
-            self._write_debug_dump,
-            category,
-            payload,
-        )
+    def _prune_debug_dumps(self) -> None:
+        """Delete dump files older than the retention window."""
+        cutoff = time() - _DEBUG_DUMP_RETENTION_S
+        for path in self._debug_dump_dir.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _drain_dump_queue(self, batch: list[_QueuedDump]) -> bool:
+        """Move queued dumps into *batch*; return True at the stop sentinel."""
+        queue = self._dump_queue
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is None:
+                return True
+            batch.append(item)
+        return False
+
+    async def _async_dump_writer(self) -> None:
+        """Flush queued dumps at most once per flush window.
+
+        Exits after flushing everything queued before the ``None`` sentinel.
+        When cancelled, the in-hand batch and the queue are flushed first.
+        """
+        queue = self._dump_queue
+        batch: list[_QueuedDump] = []
+        write: asyncio.Future[None] | None = None
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                batch.append(item)
+                # Let dumps from the same burst (MQTT events, several VINs
+                # polling together) join this batch.
+                await asyncio.sleep(_DEBUG_DUMP_FLUSH_DELAY_S)
+                stop = self._drain_dump_queue(batch)
+                write = self._hass.async_add_executor_job(
+                    self._write_debug_batch, batch
+                )
+                batch = []
+                # Shielded so a cancel never leaves a write running behind us.
+                await asyncio.shield(write)
+                if stop:
+                    return
+        except asyncio.CancelledError:
+            if write is not None and not write.done():
+                await write
+            self._drain_dump_queue(batch)
+            if batch:
+                await self._hass.async_add_executor_job(self._write_debug_batch, batch)
+            raise
 
     def _handle_vehicle_info(self, vin: str, data: VehicleRealtimeData) -> None:
         """Handle typed vehicleInfo push from pyBYD.
@@ -153,7 +348,11 @@ class BydApi:
         pyBYD parses the raw MQTT payload into a ``VehicleRealtimeData``
         model and delivers it here — no additional parsing needed.
         """
-        coordinator = self._coordinators.get(vin)
+        coordinator = (
+            self._single_coordinator
+            if vin == self._single_vin
+            else self._coordinators.get(vin)
+        )
         if coordinator is None:
             _LOGGER.debug(
                 "MQTT vehicleInfo for unknown VIN: %s (known: %s)",
@@ -191,9 +390,7 @@ class BydApi:
                 "mqtt_event": event,
                 "respond_data": respond_data,
             }
-            self._hass.async_create_task(
-                self._async_write_debug_dump(f"mqtt_{event}", dump)
-            )
+            self.enqueue_debug_dump(f"mqtt_{event}", dump)
 
     def _handle_command_ack(
         self,
@@ -224,18 +421,54 @@ class BydApi:
             vin[-6:] if vin else "-",
             serial,
         )
-        coordinator = self._coordinators.get(vin)
+        coordinator = (
+            self._single_coordinator
+            if vin == self._single_vin
+            else self._coordinators.get(vin)
+        )
         if coordinator is not None:
             # Nudge entities so optimistic states are re-evaluated.
             coordinator.async_set_updated_data(coordinator.data)
             # Schedule data refreshes after a short grace period so the
             # BYD cloud has time to propagate the new state.
-            self._hass.async_create_task(
-                coordinator.async_fetch_hvac_delayed(_MQTT_HVAC_FETCH_DELAY_S)
-            )
-            self._hass.async_create_task(
-                coordinator.async_fetch_realtime_delayed(_MQTT_HVAC_FETCH_DELAY_S)
-            )
+            coordinator.schedule_command_refresh()
+
+    async def _dedup(
+        self, key: tuple[str, str], factory: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Await *factory()*, sharing one in-flight request per *key*.
+
+        A forced refresh that overlaps a scheduled poll reuses the pending
+        request instead of issuing a second identical one.  The shared task
+        is shielded so a cancelled caller does not cancel the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._hass.async_create_task(factory())
+            self._inflight[key] = task
+
+            def _done(finished: asyncio.Task[Any]) -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                if not finished.cancelled():
+                    finished.exception()  # mark retrieved if every caller left
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    def fetch_realtime(
+        self, client: BydClient, vin: str
+    ) -> Awaitable[VehicleRealtimeData]:
+        """Fetch realtime data, joining an identical request in flight."""
+        return self._dedup(("realtime", vin), lambda: client.get_vehicle_realtime(vin))
+
+    def fetch_hvac(self, client: BydClient, vin: str) -> Awaitable[HvacStatus]:
+        """Fetch HVAC status, joining an identical request in flight."""
+        return self._dedup(("hvac", vin), lambda: client.get_hvac_status(vin))
+
+    def fetch_gps(self, client: BydClient, vin: str) -> Awaitable[GpsInfo]:
+        """Fetch GPS info, joining an identical request in flight."""
+        return self._dedup(("gps", vin), lambda: client.get_gps_info(vin))
 
     @property
     def config(self) -> BydConfig:
@@ -247,16 +480,32 @@ class BydApi:
         """Whether debug dumps are currently enabled."""
         return self._debug_dumps_enabled
 
-    async def async_write_debug_dump(
-        self,
-        category: str,
-        payload: dict[str, Any],
-    ) -> None:
-        """Write a debug dump file (public entry point for coordinators)."""
-        await self._async_write_debug_dump(category, payload)
+    @callback
+    def enqueue_debug_dump(self, category: str, payload: dict[str, Any]) -> None:
+        """Queue a debug dump for the background writer."""
+        if not self._debug_dumps_enabled:
+            return
+        if self._dump_writer is None:
+            # Entry-scoped so HA cancels it on unload and failed setup.
+            self._dump_writer = self._entry.async_create_background_task(
+                self._hass, self._async_dump_writer(), f"{DOMAIN}_debug_dump_writer"
+            )
+        elif self._dump_writer.done():
+            # Shut down; nothing would write this dump.
+            return
+        try:
+            self._dump_queue.put_nowait((category, time_ns(), payload))
+        except asyncio.QueueFull:
+            _LOGGER.debug("BYD debug dump queue full; dropping %s dump", category)
 
     async def async_shutdown(self) -> None:
-        """Tear down the pyBYD client (for use during unload)."""
+        """Let the dump writer flush and exit, then tear down the pyBYD client."""
+        writer = self._dump_writer
+        if writer is not None and not writer.done():
+            await self._dump_queue.put(None)
+            # wait() rather than await: a writer cancelled meanwhile has
+            # already flushed, and its CancelledError is not ours.
+            await asyncio.wait((writer,))
         await self._invalidate_client()
 
     async def _ensure_client(self) -> BydClient:
@@ -306,24 +555,29 @@ class BydApi:
         This wrapper only maps pyBYD exceptions into Home Assistant
         ConfigEntry/Auth errors and recreates the transport on hard failures.
         """
-        call_started = perf_counter()
-        _LOGGER.debug(
-            "BYD API call started: entry_id=%s, vin=%s, command=%s",
-            self._entry.entry_id,
-            vin[-6:] if vin else "-",
-            command or "-",
-        )
-        try:
-            client = await self._ensure_client()
-            result = await handler(client)
+        # Timing only feeds debug logs; skip the clock reads otherwise.
+        debug_on = _LOGGER.isEnabledFor(logging.DEBUG)
+        call_started = perf_counter_ns() if debug_on else 0
+        vin_tail = vin[-6:] if vin else "-"
+        if debug_on:
             _LOGGER.debug(
-                "BYD API call succeeded: entry_id=%s, vin=%s, command=%s, "
-                "duration_ms=%.1f",
+                "BYD API call started: entry_id=%s, vin=%s, command=%s",
                 self._entry.entry_id,
-                vin[-6:] if vin else "-",
+                vin_tail,
                 command or "-",
-                (perf_counter() - call_started) * 1000,
             )
+        try:
+            client = await self._ensure_client()
+            result = await handler(client)
+            if debug_on:
+                _LOGGER.debug(
+                    "BYD API call succeeded: entry_id=%s, vin=%s, command=%s, "
+                    "duration_ms=%.1f",
+                    self._entry.entry_id,
+                    vin_tail,
+                    command or "-",
+                    (perf_counter_ns() - call_started) / 1_000_000,
+                )
             return result
         except BydSessionExpiredError:
             # Session invalidated elsewhere; reconnect and retry once.
@@ -356,15 +610,16 @@ class BydApi:
         except BydApiError as exc:
             raise UpdateFailed(str(exc)) from exc
         except Exception as exc:  # noqa: BLE001
-            _LOGGER.debug(
-                "BYD API call failed: entry_id=%s, vin=%s, command=%s, "
-                "duration_ms=%.1f, error=%s",
-                self._entry.entry_id,
-                vin[-6:] if vin else "-",
-                command or "-",
-                (perf_counter() - call_started) * 1000,
-                type(exc).__name__,
-            )
+            if debug_on:
+                _LOGGER.debug(
+                    "BYD API call failed: entry_id=%s, vin=%s, command=%s, "
+                    "duration_ms=%.1f, error=%s",
+                    self._entry.entry_id,
+                    vin_tail,
+                    command or "-",
+                    (perf_counter_ns() - call_started) / 1_000_000,
+                    type(exc).__name__,
+                )
             raise
 
 
@@ -379,21 +634,30 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         vin: str,
         poll_interval: int,
     ) -> None:
+        vin_tail = vin[-6:]
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN}_telemetry_{vin[-6:]}",
+            name=f"{DOMAIN}_telemetry_{vin_tail}",
             update_interval=timedelta(seconds=poll_interval),
+            # Polls that return data equal to the previous poll (e.g. a
+            # parked car) do not wake entity listeners.
+            always_update=False,
         )
         self._api = api
         self._vehicle = vehicle
         self._vin = vin
+        self._vin_tail = vin_tail
+        # The vehicle never changes, so every poll shares one map.
+        self._vehicle_map = {vin: vehicle}
         self._fixed_interval = timedelta(seconds=poll_interval)
         self._polling_enabled = True
         self._force_next_refresh = False
         # Local state tracking for conditional fetching.
         self._last_realtime: VehicleRealtimeData | None = None
         self._last_hvac: HvacStatus | None = None
+        # Bit i set when _SEAT_HVAC_FIELDS[i] was active in _last_hvac.
+        self._active_seat_mask = 0
         # Optimistic HVAC guard — prevents stale API data from
         # overwriting a recent optimistic patch.
         self._optimistic_hvac_until: float | None = None
@@ -401,15 +665,108 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Tracks whether the realtime HTTP endpoint is permanently unsupported
         # for this vehicle; once True, warnings are downgraded to DEBUG.
         self._realtime_endpoint_unsupported: bool = False
+        # Binary sensor values resolved in one pass per update; the resolver
+        # is registered by the binary_sensor platform.
+        self._binary_sensor_resolver: BinarySensorResolver | None = None
+        self.binary_sensor_snapshot: dict[str, bool | None] = {}
+        # Until this monotonic time, polls notify entities even if unchanged.
+        self._notify_polls_until = 0.0
+        # (model, serialized dump) per data section, for debug dumps.
+        self._dump_cache: dict[str, tuple[Any, dict[str, Any]]] = {}
+        # (hvac, realtime, params) for the models the params were built from.
+        self._seat_params: tuple[Any, Any, SeatClimateParams] | None = None
+        # Post-command refreshes; acks arriving within the cooldown share
+        # a single HVAC and a single realtime fetch.
+        self._hvac_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_MQTT_HVAC_FETCH_DELAY_S,
+            immediate=False,
+            function=self._async_command_fetch_hvac,
+        )
+        self._realtime_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_MQTT_HVAC_FETCH_DELAY_S,
+            immediate=False,
+            function=self._async_command_fetch_realtime,
+        )
+
+    def set_binary_sensor_resolver(self, resolver: BinarySensorResolver) -> None:
+        """Register the binary sensor resolver and build the first snapshot."""
+        self._binary_sensor_resolver = resolver
+        self._update_binary_sensor_snapshot()
+
+    def _update_binary_sensor_snapshot(self) -> None:
+        if self._binary_sensor_resolver is None:
+            return
+        realtime = lookup_vin_data(self.data, "realtime", self._vin)
+        self.binary_sensor_snapshot = self._binary_sensor_resolver(realtime)
+
+    def _cached_dump(
+        self, section: str, model: VehicleRealtimeData | HvacStatus
+    ) -> dict[str, Any]:
+        """Return ``model.model_dump(mode="json")`` for a data *section*.
+
+        The dump is reused while the same model object is current for the
+        section; the cache holds the model, so its identity stays valid.
+        """
+        cached = self._dump_cache.get(section)
+        if cached is not None and cached[0] is model:
+            return cached[1]
+        dumped = model.model_dump(mode="json")
+        self._dump_cache[section] = (model, dumped)
+        return dumped
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Refresh derived snapshots before notifying entities."""
+        self._update_binary_sensor_snapshot()
+        super().async_update_listeners()
+
+    def _remember_hvac(self, hvac: HvacStatus) -> None:
+        """Store *hvac* as last-known state and track its active seats."""
+        self._last_hvac = hvac
+        self._active_seat_mask = _active_seat_mask(hvac)
+
+    def _publish(self, section: str, value: Any) -> None:
+        """Store *value* for this VIN under *section* and notify entities.
+
+        ``self.data`` is ``None`` until the first refresh and a dict built
+        by this coordinator afterwards.  It is updated in place; each poll
+        returns a fresh dict, so nothing else holds a reference.
+        """
+        if self.data is None:
+            return
+        section_map = self.data.get(section)
+        if section_map is None:
+            self.data[section] = {self._vin: value}
+        else:
+            section_map[self._vin] = value
+        self.async_set_updated_data(self.data)
+
+    @callback
+    def async_restore(
+        self, realtime: VehicleRealtimeData | None, hvac: HvacStatus | None
+    ) -> None:
+        """Seed last-known telemetry persisted by a previous run."""
+        data: dict[str, Any] = {
+            "vehicles": self._vehicle_map,
+            "realtime": {},
+            "hvac": {},
+        }
+        if realtime is not None:
+            self._last_realtime = realtime
+            data["realtime"][self._vin] = realtime
+        if hvac is not None:
+            self._remember_hvac(hvac)
+            data["hvac"][self._vin] = hvac
+        self.async_set_updated_data(data)
 
     def handle_mqtt_realtime(self, data: VehicleRealtimeData) -> None:
         """Accept an MQTT-pushed realtime update and push to entities."""
         self._last_realtime = data
-        if not isinstance(self.data, dict):
-            return
-        new_data = dict(self.data)
-        new_data["realtime"] = {self._vin: data}
-        self.async_set_updated_data(new_data)
+        self._publish("realtime", data)
 
     @staticmethod
     def _is_vehicle_on(realtime: VehicleRealtimeData | None) -> bool | None:
@@ -417,11 +774,36 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return None
         return realtime.is_vehicle_on
 
+    @callback
+    def keep_notifying(self, seconds: float) -> None:
+        """Notify entities on every poll for *seconds* plus one poll interval.
+
+        Optimistic entity state is only re-evaluated on coordinator updates,
+        so polls must keep arriving until its TTL has had a chance to lapse.
+        """
+        until = monotonic() + seconds + self._fixed_interval.total_seconds()
+        self._notify_polls_until = max(self._notify_polls_until, until)
+
     @property
     def is_vehicle_on(self) -> bool:
         """Whether the vehicle is currently powered on (based on last realtime)."""
         return self._is_vehicle_on(self._last_realtime) is True
 
+    def seat_climate_params(
+        self, hvac: HvacStatus | None, realtime: VehicleRealtimeData | None
+    ) -> SeatClimateParams:
+        """Return ``SeatClimateParams.from_current_state(hvac, realtime)``.
+
+        The result is reused while the same HVAC and realtime objects are
+        current, so back-to-back seat commands build it once.
+        """
+        cached = self._seat_params
+        if cached is not None and cached[0] is hvac and cached[1] is realtime:
+            return cached[2]
+        params = SeatClimateParams.from_current_state(hvac, realtime)
+        self._seat_params = (hvac, realtime, params)
+        return params
+
     @property
     def hvac_command_pending(self) -> bool:
         """Return True while a coordinator-level optimistic HVAC guard is active."""
@@ -455,7 +837,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Guard expired — accept whatever the API returns.
             _LOGGER.debug(
                 "Optimistic HVAC guard expired for %s — accepting API data",
-                self._vin[-6:],
+                self._vin_tail,
             )
             self._optimistic_hvac_until = None
             self._optimistic_ac_expected = None
@@ -464,7 +846,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # API confirms the expected state — accept and clear guard.
             _LOGGER.debug(
                 "Optimistic HVAC guard confirmed for %s — accepting API data",
-                self._vin[-6:],
+                self._vin_tail,
             )
             self._optimistic_hvac_until = None
             self._optimistic_ac_expected = None
@@ -472,7 +854,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         _LOGGER.debug(
             "Discarding stale HVAC data for %s (expected ac_on=%s, got ac_on=%s, "
             "guard active for %.0fs more)",
-            self._vin[-6:],
+            self._vin_tail,
             self._optimistic_ac_expected,
             hvac.is_ac_on,
             self._optimistic_hvac_until - monotonic(),
@@ -480,28 +862,41 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return False
 
     async def _async_update_data(self) -> dict[str, Any]:
-        _LOGGER.debug("Telemetry refresh started: vin=%s", self._vin[-6:])
+        _LOGGER.debug("Telemetry refresh started: vin=%s", self._vin_tail)
 
         force = self._force_next_refresh
         self._force_next_refresh = False
 
         if not self._polling_enabled and not force:
-            if isinstance(self.data, dict):
+            if self.data is not None:
                 return self.data
-            return {"vehicles": {self._vin: self._vehicle}}
+            return {"vehicles": self._vehicle_map}
 
         async def _fetch(client: BydClient) -> dict[str, Any]:
-            vehicle_map = {self._vin: self._vehicle}
-            endpoint_failures: dict[str, str] = {}
+            # Raw exceptions; only formatted if the warning below is emitted.
+            endpoint_failures: dict[str, BaseException] = {}
+
+            # --- Realtime (always) + HVAC (when the cached gate allows) ---
+            # Both requests go out together when the last-known realtime
+            # already says HVAC is needed; otherwise HVAC is decided below
+            # from the fresh realtime as before.
+            hvac_with_realtime = self._should_fetch_hvac(
+                self._last_realtime, force=force
+            )
+            requests: list[Awaitable[Any]] = [
+                self._api.fetch_realtime(client, self._vin)
+            ]
+            if hvac_with_realtime:
+                requests.append(self._api.fetch_hvac(client, self._vin))
+            results = await asyncio.gather(*requests, return_exceptions=True)
+            for result in results:
+                if isinstance(result, _AUTH_ERRORS):
+                    raise result
 
-            # --- Realtime (always) ---
             realtime: VehicleRealtimeData | None = None
-            try:
-                realtime = await client.get_vehicle_realtime(self._vin)
-            except _AUTH_ERRORS:
-                raise
-            except BydEndpointNotSupportedError as exc:
-                endpoint_failures["realtime"] = f"{type(exc).__name__}: {exc}"
+            realtime_result = results[0]
+            if isinstance(realtime_result, BydEndpointNotSupportedError):
+                endpoint_failures["realtime"] = realtime_result
                 if not self._realtime_endpoint_unsupported:
                     _LOGGER.warning(
                         "Realtime HTTP endpoint not supported for vin=%s — "
@@ -513,45 +908,57 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     _LOGGER.debug(
                         "Realtime HTTP endpoint not supported for vin=%s"
                         " (expected, using MQTT)",
-                        self._vin[-6:],
+                        self._vin_tail,
                     )
-            except _RECOVERABLE_ERRORS as exc:
-                endpoint_failures["realtime"] = f"{type(exc).__name__}: {exc}"
+            elif isinstance(realtime_result, _RECOVERABLE_ERRORS):
+                endpoint_failures["realtime"] = realtime_result
                 _LOGGER.warning(
-                    "Realtime fetch failed: vin=%s, error=%s", self._vin, exc
+                    "Realtime fetch failed: vin=%s, error=%s",
+                    self._vin,
+                    realtime_result,
                 )
+            elif isinstance(realtime_result, BaseException):
+                raise realtime_result
+            else:
+                realtime = realtime_result
 
             # Use fresh realtime or fall back to previous cycle.
             realtime_gate = realtime or self._last_realtime
 
-            # --- HVAC (conditional) ---
             hvac: HvacStatus | None = None
-            if self._should_fetch_hvac(realtime_gate, force=force):
+            hvac_result: Any = None
+            if hvac_with_realtime:
+                hvac_result = results[1]
+            elif self._should_fetch_hvac(realtime_gate, force=force):
                 try:
-                    hvac = await client.get_hvac_status(self._vin)
+                    hvac_result = await self._api.fetch_hvac(client, self._vin)
                 except _AUTH_ERRORS:
                     raise
                 except _RECOVERABLE_ERRORS as exc:
-                    endpoint_failures["hvac"] = f"{type(exc).__name__}: {exc}"
-                    _LOGGER.warning(
-                        "HVAC fetch failed: vin=%s, error=%s",
-                        self._vin,
-                        exc,
-                    )
-                # Discard stale HVAC that contradicts the optimistic guard.
-                if hvac is not None and not self._accept_hvac_update(hvac):
-                    hvac = None
+                    hvac_result = exc
             else:
                 _LOGGER.debug(
                     "HVAC fetch skipped: vin=%s, reason=vehicle_not_on",
-                    self._vin[-6:],
+                    self._vin_tail,
                 )
+            if isinstance(hvac_result, _RECOVERABLE_ERRORS):
+                endpoint_failures["hvac"] = hvac_result
+                _LOGGER.warning(
+                    "HVAC fetch failed: vin=%s, error=%s",
+                    self._vin,
+                    hvac_result,
+                )
+            elif isinstance(hvac_result, BaseException):
+                raise hvac_result
+            # Discard stale HVAC that contradicts the optimistic guard.
+            elif hvac_result is not None and self._accept_hvac_update(hvac_result):
+                hvac = hvac_result
 
             # Update local state for next cycle's conditional decisions.
             if realtime is not None:
                 self._last_realtime = realtime
             if hvac is not None:
-                self._last_hvac = hvac
+                self._remember_hvac(hvac)
 
             # Build result maps, falling back to last-known data.
             realtime_map: dict[str, Any] = {}
@@ -575,7 +982,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     # entering a failed state.
                     _LOGGER.debug(
                         "Realtime unavailable for vin=%s — waiting for MQTT push",
-                        self._vin[-6:],
+                        self._vin_tail,
                     )
                 else:
                     raise UpdateFailed(
@@ -583,36 +990,37 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         "no data returned from API"
                     )
 
-            if endpoint_failures:
+            if endpoint_failures and _LOGGER.isEnabledFor(logging.WARNING):
                 _LOGGER.warning(
                     "Telemetry partial refresh: vin=%s, endpoint_failures=%s",
-                    self._vin[-6:],
-                    endpoint_failures,
+                    self._vin_tail,
+                    _format_failures(endpoint_failures),
                 )
 
             # Debug dumps via model serialization.
             if self._api.debug_dumps_enabled:
                 dump: dict[str, Any] = {"vin": self._vin, "sections": {}}
                 if effective_realtime is not None:
-                    dump["sections"]["realtime"] = effective_realtime.model_dump(
-                        mode="json"
+                    dump["sections"]["realtime"] = self._cached_dump(
+                        "realtime", effective_realtime
                     )
                 if effective_hvac is not None:
-                    dump["sections"]["hvac"] = effective_hvac.model_dump(mode="json")
-                self.hass.async_create_task(
-                    self._api.async_write_debug_dump("telemetry", dump)
-                )
+                    dump["sections"]["hvac"] = self._cached_dump("hvac", effective_hvac)
+                self._api.enqueue_debug_dump("telemetry", dump)
 
             return {
-                "vehicles": vehicle_map,
+                "vehicles": self._vehicle_map,
                 "realtime": realtime_map,
                 "hvac": hvac_map,
             }
 
         data = await self._api.async_call(_fetch)
+        # Deliver even unchanged polls while optimistic state may be waiting
+        # on one to re-check its TTL.
+        self.always_update = monotonic() < self._notify_polls_until
         _LOGGER.debug(
             "Telemetry refresh succeeded: vin=%s, realtime=%s, hvac=%s",
-            self._vin[-6:],
+            self._vin_tail,
             self._vin in data.get("realtime", {}),
             self._vin in data.get("hvac", {}),
         )
@@ -637,59 +1045,61 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Force-fetch realtime data and merge into coordinator state."""
 
         async def _fetch(client: BydClient) -> VehicleRealtimeData:
-            return await client.get_vehicle_realtime(self._vin)
+            return await self._api.fetch_realtime(client, self._vin)
 
         data: VehicleRealtimeData = await self._api.async_call(
             _fetch, vin=self._vin, command="fetch_realtime"
         )
         self._last_realtime = data
-        if isinstance(self.data, dict):
-            merged = dict(self.data)
-            merged["realtime"] = {self._vin: data}
-            self.async_set_updated_data(merged)
+        self._publish("realtime", data)
 
     async def async_fetch_hvac(self) -> None:
         """Force-fetch HVAC status and merge into coordinator state."""
 
         async def _fetch(client: BydClient) -> HvacStatus:
-            return await client.get_hvac_status(self._vin)
+            return await self._api.fetch_hvac(client, self._vin)
 
         data: HvacStatus = await self._api.async_call(
             _fetch, vin=self._vin, command="fetch_hvac"
         )
         if not self._accept_hvac_update(data):
             return
-        self._last_hvac = data
-        if isinstance(self.data, dict):
-            merged = dict(self.data)
-            merged["hvac"] = {self._vin: data}
-            self.async_set_updated_data(merged)
-
-    async def async_fetch_hvac_delayed(self, delay: float) -> None:
-        """Wait *delay* seconds, then force-fetch HVAC and merge."""
-        await asyncio.sleep(delay)
+        self._remember_hvac(data)
+        self._publish("hvac", data)
+
+    @callback
+    def schedule_command_refresh(self) -> None:
+        """Fetch HVAC and realtime once the post-command cooldown passes."""
+        self._hvac_debouncer.async_schedule_call()
+        self._realtime_debouncer.async_schedule_call()
+
+    async def _async_command_fetch_hvac(self) -> None:
         try:
             await self.async_fetch_hvac()
         except Exception:  # noqa: BLE001
             _LOGGER.debug(
                 "Command-triggered HVAC fetch failed for %s — will retry at next poll",
-                self._vin[-6:],
+                self._vin_tail,
                 exc_info=True,
             )
 
-    async def async_fetch_realtime_delayed(self, delay: float) -> None:
-        """Wait *delay* seconds, then force-fetch realtime and merge."""
-        await asyncio.sleep(delay)
+    async def _async_command_fetch_realtime(self) -> None:
         try:
             await self.async_fetch_realtime()
         except Exception:  # noqa: BLE001
             _LOGGER.debug(
                 "Command-triggered realtime fetch failed "
                 "for %s — will retry at next poll",
-                self._vin[-6:],
+                self._vin_tail,
                 exc_info=True,
             )
 
+    async def async_shutdown(self) -> None:
+        """Cancel pending post-command refreshes, then shut down."""
+        self._hvac_debouncer.async_shutdown()
+        self._realtime_debouncer.async_shutdown()
+        await super().async_shutdown()
+
     def apply_optimistic_hvac(
         self,
         *,
@@ -716,7 +1126,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ``StearingWheelHeat.OFF``.  Use when stopping climate,
             since the BYD car resets these.
         """
-        if not isinstance(self.data, dict):
+        if self.data is None:
             return
         current_hvac: HvacStatus | None = self.data.get("hvac", {}).get(self._vin)
         if current_hvac is None:
@@ -731,14 +1141,16 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if target_temp is not None:
             updates["main_setting_temp_new"] = target_temp
         if reset_seats:
-            for field in _SEAT_HVAC_FIELDS:
-                # Only reset seats that were actually active.
-                val = getattr(current_hvac, field, None)
-                if val is not None and val not in (
-                    SeatHeatVentState.OFF,
-                    SeatHeatVentState.NO_DATA,
-                ):
-                    updates[field] = SeatHeatVentState.OFF
+            # Only reset seats that were actually active.
+            mask = (
+                self._active_seat_mask
+                if current_hvac is self._last_hvac
+                else _active_seat_mask(current_hvac)
+            )
+            while mask:
+                bit = (mask & -mask).bit_length() - 1
+                mask &= mask - 1
+                updates[_SEAT_HVAC_FIELDS[bit]] = SeatHeatVentState.OFF
             sw_val = getattr(current_hvac, _STEERING_WHEEL_FIELD, None)
             if sw_val is not None and sw_val != StearingWheelHeat.OFF:
                 updates[_STEERING_WHEEL_FIELD] = StearingWheelHeat.OFF
@@ -747,15 +1159,14 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         patched = current_hvac.model_copy(update=updates)
-        self._last_hvac = patched
-        merged = dict(self.data)
-        merged["hvac"] = {self._vin: patched}
-        self.async_set_updated_data(merged)
+        self._remember_hvac(patched)
+        self._publish("hvac", patched)
         # Arm the optimistic guard so stale API responses are discarded
         # until the cloud confirms the expected state.
         if ac_on is not None:
             self._optimistic_hvac_until = monotonic() + _OPTIMISTIC_HVAC_GUARD_TTL_S
             self._optimistic_ac_expected = ac_on
+            self.keep_notifying(_OPTIMISTIC_HVAC_GUARD_TTL_S)
         guard = (
             f"ac_on={ac_on} for {_OPTIMISTIC_HVAC_GUARD_TTL_S}s"
             if ac_on is not None
@@ -763,7 +1174,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         _LOGGER.debug(
             "Optimistic HVAC update applied: vin=%s, updates=%s, guard=%s",
-            self._vin[-6:],
+            self._vin_tail,
             list(updates.keys()),
             guard,
         )
@@ -785,24 +1196,42 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         active_interval: int = 30,
         inactive_interval: int = 600,
     ) -> None:
+        vin_tail = vin[-6:]
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN}_gps_{vin[-6:]}",
+            name=f"{DOMAIN}_gps_{vin_tail}",
             update_interval=timedelta(seconds=poll_interval),
+            # Polls that return data equal to the previous poll (e.g. a
+            # parked car) do not wake entity listeners.
+            always_update=False,
         )
         self._api = api
         self._vehicle = vehicle
         self._vin = vin
+        self._vin_tail = vin_tail
+        # The vehicle never changes, so every poll shares one map.
+        self._vehicle_map = {vin: vehicle}
         self._telemetry_coordinator = telemetry_coordinator
         self._smart_polling = bool(smart_polling)
         self._fixed_interval = timedelta(seconds=poll_interval)
-        self._active_interval = timedelta(seconds=active_interval)
-        self._inactive_interval = timedelta(seconds=inactive_interval)
+        # Smart-polling intervals indexed by vehicle-on state (0=off, 1=on).
+        self._smart_intervals = (
+            timedelta(seconds=inactive_interval),
+            timedelta(seconds=active_interval),
+        )
         self._current_interval = self._fixed_interval
         self._polling_enabled = True
         self._force_next_refresh = False
         self._last_gps: GpsInfo | None = None
+        # Re-evaluate the smart interval as soon as telemetry reports the
+        # vehicle switching on or off, not only after the next GPS poll.
+        self._last_vehicle_on: bool | None = None
+        self._unsub_telemetry: Callable[[], None] | None = None
+        if telemetry_coordinator is not None and self._smart_polling:
+            self._unsub_telemetry = telemetry_coordinator.async_add_listener(
+                self._on_telemetry_update
+            )
 
     @property
     def polling_enabled(self) -> bool:
@@ -823,7 +1252,7 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Force-fetch GPS data and merge into coordinator state."""
 
         async def _fetch(client: BydClient) -> GpsInfo:
-            return await client.get_gps_info(self._vin)
+            return await self._api.fetch_gps(client, self._vin)
 
         raw: GpsInfo = await self._api.async_call(
             _fetch, vin=self._vin, command="fetch_gps"
@@ -831,42 +1260,73 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data = guard_gps_coordinates(self._last_gps, raw)
         if data is not None:
             self._last_gps = data
-        if isinstance(self.data, dict):
-            merged = dict(self.data)
-            if data is not None:
-                merged["gps"] = {self._vin: data}
-            self.async_set_updated_data(merged)
+        if self.data is None:
+            return
+        # Patch only this VIN's GPS into the existing data, as the telemetry
+        # coordinator does for pushes.
+        if data is not None:
+            gps_map = self.data.get("gps")
+            if gps_map is None:
+                self.data["gps"] = {self._vin: data}
+            else:
+                gps_map[self._vin] = data
+        self.async_set_updated_data(self.data)
+
+    @callback
+    def async_restore(self, gps: GpsInfo) -> None:
+        """Seed the last-known location persisted by a previous run."""
+        self._last_gps = gps
+        self._adjust_interval()
+        self.async_set_updated_data(
+            {"vehicles": self._vehicle_map, "gps": {self._vin: gps}}
+        )
+
+    @callback
+    def _on_telemetry_update(self) -> None:
+        """Tighten or relax GPS polling when the vehicle turns on or off."""
+        telemetry = self._telemetry_coordinator
+        vehicle_on = telemetry is not None and telemetry.is_vehicle_on
+        if vehicle_on == self._last_vehicle_on:
+            return
+        self._last_vehicle_on = vehicle_on
+        self._adjust_interval()
+        # The pending timer still uses the old (long) interval; refresh now
+        # so the next one is scheduled with the active interval.
+        if vehicle_on and self._polling_enabled and self.data is not None:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_shutdown(self) -> None:
+        """Stop following telemetry updates, then shut down."""
+        if self._unsub_telemetry is not None:
+            self._unsub_telemetry()
+            self._unsub_telemetry = None
+        await super().async_shutdown()
 
     def _adjust_interval(self) -> None:
         if not self._smart_polling:
             self._current_interval = self._fixed_interval
         else:
-            self._current_interval = (
-                self._active_interval
-                if self._telemetry_coordinator is not None
-                and self._telemetry_coordinator.is_vehicle_on
-                else self._inactive_interval
-            )
+            telemetry = self._telemetry_coordinator
+            vehicle_on = telemetry is not None and telemetry.is_vehicle_on
+            self._current_interval = self._smart_intervals[vehicle_on]
         if self._polling_enabled:
             self.update_interval = self._current_interval
 
     async def _async_update_data(self) -> dict[str, Any]:
-        _LOGGER.debug("GPS refresh started: vin=%s", self._vin[-6:])
+        _LOGGER.debug("GPS refresh started: vin=%s", self._vin_tail)
 
         force = self._force_next_refresh
         self._force_next_refresh = False
 
         if not self._polling_enabled and not force:
-            if isinstance(self.data, dict):
+            if self.data is not None:
                 return self.data
-            return {"vehicles": {self._vin: self._vehicle}}
+            return {"vehicles": self._vehicle_map}
 
         async def _fetch(client: BydClient) -> dict[str, Any]:
-            vehicle_map = {self._vin: self._vehicle}
-
             gps: GpsInfo | None = None
             try:
-                gps = await client.get_gps_info(self._vin)
+                gps = await self._api.fetch_gps(client, self._vin)
             except _AUTH_ERRORS:
                 raise
             except _RECOVERABLE_ERRORS as exc:
@@ -879,7 +1339,7 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.debug(
                     "GPS coordinates unavailable for vin=%s (lat=%s, lon=%s) "
                     "— keeping previous known-good location",
-                    self._vin[-6:],
+                    self._vin_tail,
                     gps.latitude,
                     gps.longitude,
                 )
@@ -892,18 +1352,14 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not gps_map:
                 raise UpdateFailed(f"GPS fetch failed for {self._vin}")
 
-            # Debug dump for GPS.
+            # Debug dump for GPS; the model is serialized by the dump writer
+            # in the executor rather than here on the event loop.
             if self._api.debug_dumps_enabled and gps is not None:
-                dump = {
-                    "vin": self._vin,
-                    "sections": {"gps": gps.model_dump(mode="json")},
-                }
-                self.hass.async_create_task(
-                    self._api.async_write_debug_dump("gps", dump)
-                )
+                dump = {"vin": self._vin, "sections": {"gps": gps}}
+                self._api.enqueue_debug_dump("gps", dump)
 
             return {
-                "vehicles": vehicle_map,
+                "vehicles": self._vehicle_map,
                 "gps": gps_map,
             }
 
@@ -911,7 +1367,7 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._adjust_interval()
         _LOGGER.debug(
             "GPS refresh succeeded: vin=%s, gps=%s",
-            self._vin[-6:],
+            self._vin_tail,
             self._vin in data.get("gps", {}),
         )
         return data
@@ -11,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import BydGpsUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 
 
 async def async_setup_entry(
@@ -26,7 +26,7 @@ async def async_setup_entry(
     entities: list[TrackerEntity] = []
 
     for vin, gps_coordinator in gps_coordinators.items():
-        vehicle = gps_coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(gps_coordinator, vin)
         if vehicle is None:
             continue
         entities.append(BydDeviceTracker(gps_coordinator, vin, vehicle))
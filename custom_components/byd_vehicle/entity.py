@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from datetime import datetime
 from time import monotonic
 from typing import Any, TypeVar
 
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -18,17 +21,33 @@ from pybyd.models.gps import GpsInfo
 from pybyd.models.hvac import HvacStatus
 
 from .const import DOMAIN
-from .coordinator import BydApi, get_vehicle_display
+from .coordinator import (
+    BydApi,
+    BydDataUpdateCoordinator,
+    get_vehicle_display,
+    lookup_vin_data,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 #: Maximum seconds to hold optimistic state before falling back to API data.
 _OPTIMISTIC_TTL_SECONDS: float = 300.0
 
+#: Seconds after an HVAC command before forcing a refresh, giving the BYD
+#: cloud time to reflect it.
+_DELAYED_REFRESH_SECONDS: float = 20.0
+
 
 CoordinatorT = TypeVar("CoordinatorT", bound=DataUpdateCoordinator[dict[str, Any]])
 
 
+def get_coordinator_vehicle(
+    coordinator: DataUpdateCoordinator[dict[str, Any]], vin: str
+) -> Any | None:
+    """Return the vehicle for *vin* from a coordinator's data, or None."""
+    return lookup_vin_data(coordinator.data, "vehicles", vin)
+
+
 class BydVehicleEntity(CoordinatorEntity[CoordinatorT]):
     """Mixin providing common properties for BYD vehicle entities.
 
@@ -39,52 +58,71 @@ class BydVehicleEntity(CoordinatorEntity[CoordinatorT]):
     _vehicle: Any
     _command_pending: bool = False
     _commanded_at: float | None = None
+    _cancel_delayed_refresh: Callable[[], None] | None = None
+
+    _device_info: DeviceInfo | None = None
+    _vin_attrs: dict[str, Any] | None = None
+    #: Signature last written by a coordinator update; None after any other write.
+    _written_state: tuple[Any, ...] | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info common to every BYD entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
+        # Built once: the vehicle object never changes for an entity.
+        if self._device_info is None:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self._vin)},
+                name=get_vehicle_display(self._vehicle),
+                manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
+                model=getattr(self._vehicle, "model_name", None),
+                serial_number=self._vin,
+                hw_version=getattr(self._vehicle, "tbox_version", None) or None,
+            )
+        return self._device_info
 
     @property
     def available(self) -> bool:
         """Available when coordinator has data for this vehicle."""
         if not super().available:
             return False
-        return self._vin in self.coordinator.data.get("vehicles", {})
+        try:
+            return self._vin in self.coordinator.data["vehicles"]
+        except (KeyError, TypeError):
+            return False
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return VIN as the default extra attribute."""
-        return {"vin": self._vin}
+        # Shared across writes; subclasses copy it before adding keys.
+        if self._vin_attrs is None:
+            self._vin_attrs = {"vin": self._vin}
+        return self._vin_attrs
 
     # ------------------------------------------------------------------
     # Shared data helpers
     # ------------------------------------------------------------------
 
+    def _lookup(self, section: str) -> Any | None:
+        """Return this VIN's entry in a coordinator data section, or None."""
+        return lookup_vin_data(self.coordinator.data, section, self._vin)
+
     def _get_hvac_status(self) -> HvacStatus | None:
         """Return the HVAC status for this VIN, or None."""
-        hvac = self.coordinator.data.get("hvac", {}).get(self._vin)
+        hvac = self._lookup("hvac")
         return hvac if isinstance(hvac, HvacStatus) else None
 
     def _get_realtime(self) -> Any | None:
         """Return the realtime data for this VIN, or None."""
-        return self.coordinator.data.get("realtime", {}).get(self._vin)
+        return self._lookup("realtime")
 
     def _get_gps(self) -> GpsInfo | None:
         """Return the GPS data for this VIN, or None."""
-        gps = self.coordinator.data.get("gps", {}).get(self._vin)
+        gps = self._lookup("gps")
         return gps if isinstance(gps, GpsInfo) else None
 
     def _get_source_obj(self, source: str) -> Any | None:
         """Return the model object for the given data source and this VIN."""
-        return self.coordinator.data.get(source, {}).get(self._vin)
+        return self._lookup(source)
 
     def _is_vehicle_on(self) -> bool:
         """Return True when the realtime feed reports the vehicle is on."""
@@ -131,8 +169,35 @@ class BydVehicleEntity(CoordinatorEntity[CoordinatorT]):
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
         self._commanded_at = monotonic()
+        # Only telemetry polls re-evaluate optimistic state; GPS has no hook.
+        if isinstance(self.coordinator, BydDataUpdateCoordinator):
+            self.coordinator.keep_notifying(_OPTIMISTIC_TTL_SECONDS)
         self.async_write_ha_state()
 
+    @callback
+    def _schedule_delayed_refresh(self) -> None:
+        """Force a coordinator refresh once the cloud has caught up.
+
+        Rescheduling replaces the pending refresh, so rapid commands
+        share a single one.
+        """
+        if self._cancel_delayed_refresh is not None:
+            self._cancel_delayed_refresh()
+        self._cancel_delayed_refresh = async_call_later(
+            self.hass, _DELAYED_REFRESH_SECONDS, self._async_delayed_refresh
+        )
+
+    async def _async_delayed_refresh(self, _now: datetime) -> None:
+        self._cancel_delayed_refresh = None
+        await self.coordinator.async_force_refresh()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any pending delayed refresh."""
+        if self._cancel_delayed_refresh is not None:
+            self._cancel_delayed_refresh()
+            self._cancel_delayed_refresh = None
+        await super().async_will_remove_from_hass()
+
     def _is_command_confirmed(self) -> bool:
         """Return True when coordinator data confirms the commanded state.
 
@@ -147,6 +212,24 @@ class BydVehicleEntity(CoordinatorEntity[CoordinatorT]):
         """
         return True
 
+    # ------------------------------------------------------------------
+    # State writes
+    # ------------------------------------------------------------------
+
+    def _state_signature(self) -> tuple[Any, ...] | None:
+        """Return every coordinator-driven value HA shows for this entity.
+
+        Coordinator updates that leave the signature unchanged skip the
+        state write.  The default ``None`` writes on every update.
+        """
+        return None
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write state and forget the signature it may have changed."""
+        self._written_state = None
+        super().async_write_ha_state()
+
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic flag when data confirms the command or TTL expires."""
         if self._command_pending:
@@ -157,4 +240,8 @@ class BydVehicleEntity(CoordinatorEntity[CoordinatorT]):
             if self._is_command_confirmed() or ttl_expired:
                 self._command_pending = False
                 self._commanded_at = None
+        signature = self._state_signature()
+        if signature is not None and signature == self._written_state:
+            return
         super()._handle_coordinator_update()
+        self._written_state = signature
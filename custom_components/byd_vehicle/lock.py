@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import methodcaller
 from typing import Any
 
 from homeassistant.components.lock import LockEntity
@@ -11,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import BydApi, BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 
 
 async def async_setup_entry(
@@ -27,7 +28,7 @@ async def async_setup_entry(
     entities: list[LockEntity] = []
 
     for vin, coordinator in coordinators.items():
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(coordinator, vin)
         if vehicle is None:
             continue
         entities.append(BydLock(coordinator, api, vin, vehicle))
@@ -55,80 +56,79 @@ class BydLock(BydVehicleEntity, LockEntity):
         self._attr_unique_id = f"{vin}_lock"
         self._last_command: str | None = None
         self._last_locked: bool | None = None
+        self._extra_attrs: tuple[str | None, dict[str, Any]] | None = None
+        # pybyd derives is_locked from all four doors on each access, so it
+        # is read once per coordinator update.
+        self._realtime_locked = self._read_realtime_locked()
+
+    def _read_realtime_locked(self) -> bool | None:
+        realtime = self._get_realtime()
+        return None if realtime is None else realtime.is_locked
 
     @property
     def is_locked(self) -> bool | None:
         """Return True if all doors are locked."""
-        if self._command_pending:
+        if self._command_pending or self._realtime_locked is None:
             return self._last_locked
-        realtime = self._get_realtime()
-        if realtime is not None:
-            current: bool | None = realtime.is_locked
-            if current is not None:
-                return current
-        return self._last_locked
+        return self._realtime_locked
 
     @property
     def assumed_state(self) -> bool:
         """Return True when lock state is assumed."""
-        if self._command_pending:
-            return True
-        realtime = self._get_realtime()
-        return realtime is None or realtime.is_locked is None
+        return self._command_pending or self._realtime_locked is None
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.is_locked, self.assumed_state)
 
     def _is_command_confirmed(self) -> bool:
         """Return True when realtime lock data matches the commanded state."""
         if self._last_locked is None:
             return True
-        realtime = self._get_realtime()
-        if realtime is None:
-            return False
-        current = realtime.is_locked
+        current = self._realtime_locked
         return current is not None and current == self._last_locked
 
     def _handle_coordinator_update(self) -> None:
         """Track real API lock state, then apply standard optimistic update logic."""
-        if not self._command_pending:
-            realtime = self._get_realtime()
-            if realtime is not None:
-                current = realtime.is_locked
-                if current is not None:
-                    self._last_locked = current
+        self._realtime_locked = self._read_realtime_locked()
+        if not self._command_pending and self._realtime_locked is not None:
+            self._last_locked = self._realtime_locked
         super()._handle_coordinator_update()
 
     async def async_lock(self, **_: Any) -> None:
         """Lock the vehicle."""
-
-        async def _call(client: Any) -> Any:
-            return await client.lock(self._vin)
+        call = methodcaller("lock", self._vin)
 
         self._last_command = "lock"
         self._last_locked = True
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command="lock",
             on_rollback=lambda: setattr(self, "_last_locked", None),
         )
 
     async def async_unlock(self, **_: Any) -> None:
         """Unlock the vehicle."""
-
-        async def _call(client: Any) -> Any:
-            return await client.unlock(self._vin)
+        call = methodcaller("unlock", self._vin)
 
         self._last_command = "unlock"
         self._last_locked = False
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command="unlock",
             on_rollback=lambda: setattr(self, "_last_locked", None),
         )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        attrs = {**super().extra_state_attributes}
-        if self._last_command:
-            attrs["last_remote_command"] = self._last_command
+        base = super().extra_state_attributes
+        if not self._last_command:
+            return base
+        # Rebuilt only when the last command changes; the rest is static.
+        cached = self._extra_attrs
+        if cached is not None and cached[0] == self._last_command:
+            return cached[1]
+        attrs = {**base, "last_remote_command": self._last_command}
+        self._extra_attrs = (self._last_command, attrs)
         return attrs
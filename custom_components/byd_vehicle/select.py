@@ -6,22 +6,36 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from operator import attrgetter, methodcaller
 from typing import Any
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pybyd.models.control import SeatClimateParams
 from pybyd.models.realtime import SeatHeatVentState
 
 from .const import DOMAIN
 from .coordinator import BydApi, BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 
 # Derive options from the enum – single source of truth, no duplicate mappings.
-SEAT_LEVEL_OPTIONS = [s.name.lower() for s in SeatHeatVentState if s.value > 0]
+SEAT_LEVEL_OPTIONS: tuple[str, ...] = tuple(
+    s.name.lower() for s in SeatHeatVentState if s.value > 0
+)
+
+#: Option label per seat state.  ``SeatHeatVentState`` is an ``IntEnum``, so
+#: raw ints hit the same entries.
+_SEAT_OPTION_BY_STATE: dict[int, str] = {
+    s: s.name.lower() if s.value > 0 else "off" for s in SeatHeatVentState
+}
+
+#: Command level per selectable option.
+_OPTION_TO_LEVEL: dict[str, int] = {
+    s.name.lower(): s.to_command_level() for s in SeatHeatVentState if s.value > 0
+}
 
 
 def _seat_status_to_option(value: Any) -> str | None:
@@ -34,16 +48,16 @@ def _seat_status_to_option(value: Any) -> str | None:
     the entity exists but no data has been received yet (vehicle may be
     off). The safe assumption is the feature exists but is idle.
     """
+    option = _SEAT_OPTION_BY_STATE.get(value)
+    if option is not None:
+        return option
     if value is None:
         return "off"
-    if not isinstance(value, SeatHeatVentState):
-        try:
-            value = SeatHeatVentState(int(value))
-        except (TypeError, ValueError):
-            return "off"
-    if value == SeatHeatVentState.NO_DATA:
+    try:
+        value = SeatHeatVentState(int(value))
+    except (TypeError, ValueError):
         return "off"
-    return value.name.lower() if value.value > 0 else "off"
+    return _SEAT_OPTION_BY_STATE.get(value, "off")
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -124,13 +138,13 @@ async def async_setup_entry(
 
     entities: list[SelectEntity] = []
     for vin, coordinator in coordinators.items():
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(coordinator, vin)
         if vehicle is None:
             continue
-        for description in SEAT_CLIMATE_DESCRIPTIONS:
-            entities.append(
-                BydSeatClimateSelect(coordinator, api, vin, vehicle, description)
-            )
+        entities.extend(
+            BydSeatClimateSelect(coordinator, api, vin, vehicle, description)
+            for description in SEAT_CLIMATE_DESCRIPTIONS
+        )
 
     async_add_entities(entities)
 
@@ -139,7 +153,8 @@ class BydSeatClimateSelect(BydVehicleEntity, SelectEntity):
     """Select entity for a single seat heating/ventilation level."""
 
     _attr_has_entity_name = True
-    _attr_options = SEAT_LEVEL_OPTIONS
+    # Built once for the class; SelectEntity declares options as a list.
+    _attr_options = list(SEAT_LEVEL_OPTIONS)
 
     entity_description: BydSeatClimateDescription
 
@@ -160,6 +175,21 @@ class BydSeatClimateSelect(BydVehicleEntity, SelectEntity):
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_select_{description.key}"
         self._pending_value: str | None = None
+        self._read_state = attrgetter(description.hvac_attr)
+        self._command = sys.intern(f"seat_climate_{description.key}")
+
+    def _seat_state(self) -> Any:
+        """Return the seat state from HVAC, falling back to realtime."""
+        for model in (self._get_hvac_status(), self._get_realtime()):
+            if model is None:
+                continue
+            try:
+                value = self._read_state(model)
+            except AttributeError:
+                continue
+            if value is not None:
+                return value
+        return None
 
     @property
     def current_option(self) -> str | None:
@@ -168,22 +198,14 @@ class BydSeatClimateSelect(BydVehicleEntity, SelectEntity):
             return self._pending_value
         if self._command_pending:
             return self._pending_value
-        hvac = self._get_hvac_status()
-        realtime = self._get_realtime()
-        val = None
-        if hvac is not None:
-            val = getattr(hvac, self.entity_description.hvac_attr, None)
-        if val is None and realtime is not None:
-            val = getattr(realtime, self.entity_description.hvac_attr, None)
-        option = _seat_status_to_option(val)
+        option = _seat_status_to_option(self._seat_state())
         # Fallback: entity was created so the feature exists – default to 'off'.
         return option if option is not None else "off"
 
     async def async_select_option(self, option: str) -> None:
         """Set the seat climate level."""
-        try:
-            level = SeatHeatVentState[option.upper()].to_command_level()
-        except KeyError:
+        level = _OPTION_TO_LEVEL.get(option)
+        if level is None:
             return
 
         self._pending_value = option
@@ -191,20 +213,22 @@ class BydSeatClimateSelect(BydVehicleEntity, SelectEntity):
         # Gather current state and override our specific parameter
         hvac = self._get_hvac_status()
         realtime = self._get_realtime()
-        params = SeatClimateParams.from_current_state(hvac, realtime).with_change(
+        params = self.coordinator.seat_climate_params(hvac, realtime).with_change(
             self.entity_description.param_key, level
         )
 
-        async def _call(client: Any) -> Any:
-            return await client.set_seat_climate(self._vin, params=params)
+        call = methodcaller("set_seat_climate", self._vin, params=params)
 
         await self._execute_command(
             self._api,
-            _call,
-            command=f"seat_climate_{self.entity_description.key}",
+            call,
+            command=self._command,
             on_rollback=lambda: setattr(self, "_pending_value", None),
         )
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.current_option)
+
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic state only when fresh data confirms the command."""
         if self._pending_value is not None and self._is_command_confirmed():
@@ -215,12 +239,5 @@ class BydSeatClimateSelect(BydVehicleEntity, SelectEntity):
         """Check whether coordinator data matches the pending selection."""
         if self._pending_value is None:
             return True
-        hvac = self._get_hvac_status()
-        realtime = self._get_realtime()
-        val = None
-        if hvac is not None:
-            val = getattr(hvac, self.entity_description.hvac_attr, None)
-        if val is None and realtime is not None:
-            val = getattr(realtime, self.entity_description.hvac_attr, None)
-        option = _seat_status_to_option(val)
+        option = _seat_status_to_option(self._seat_state())
         return option == self._pending_value
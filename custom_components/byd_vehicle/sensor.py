@@ -33,7 +33,7 @@ from pybyd.models.realtime import TirePressureUnit
 
 from .const import DOMAIN
 from .coordinator import BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 from .value_guard import FieldValidator, keep_previous_when_zero
 
 
@@ -533,7 +533,7 @@ async def async_setup_entry(
 
     entities: list[SensorEntity] = []
     for vin, coordinator in coordinators.items():
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(coordinator, vin)
         if vehicle is None:
             continue
         for description in SENSOR_DESCRIPTIONS:
@@ -584,6 +584,8 @@ class BydSensor(BydVehicleEntity, SensorEntity):
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_{description.source}_{description.key}"
         self._last_native_value: Any | None = None
+        self._value_fn = description.value_fn
+        self._value_attr = description.attr_key or description.key
 
         # Auto-disable sensors that return no data on first fetch.
         # If the description already disables the entity we leave it alone.
@@ -614,10 +616,9 @@ class BydSensor(BydVehicleEntity, SensorEntity):
         obj = self._get_source_obj()
         if obj is None:
             return None
-        if self.entity_description.value_fn is not None:
-            return self.entity_description.value_fn(obj)
-        attr = self.entity_description.attr_key or self.entity_description.key
-        value = getattr(obj, attr, None)
+        if self._value_fn is not None:
+            return self._value_fn(obj)
+        value = getattr(obj, self._value_attr, None)
         enum_value = getattr(value, "value", None)
         if isinstance(enum_value, int):
             return enum_value
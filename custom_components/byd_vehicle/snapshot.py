@@ -0,0 +1,148 @@
+"""Persist last-known telemetry so entities have state right after a restart."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from pybyd.models.gps import GpsInfo
+from pybyd.models.hvac import HvacStatus
+from pybyd.models.realtime import VehicleRealtimeData
+from pydantic import BaseModel, ValidationError
+
+from .const import DOMAIN
+from .coordinator import (
+    BydDataUpdateCoordinator,
+    BydGpsUpdateCoordinator,
+    lookup_vin_data,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_VERSION = 1
+
+#: Seconds to coalesce coordinator updates into one snapshot write.
+_SAVE_DELAY_S = 30
+
+#: Snapshots older than this are ignored and the first refresh blocks setup.
+_MAX_AGE_S = 24 * 3600
+
+#: Model class per persisted data section.
+_SECTION_MODELS: dict[str, type[BaseModel]] = {
+    "realtime": VehicleRealtimeData,
+    "hvac": HvacStatus,
+    "gps": GpsInfo,
+}
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, _STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted snapshot for a removed config entry.
+
+    Runs after the entry unloaded, so :meth:`BydSnapshot.async_unload` has
+    already flushed the entry's own store and no delayed write is pending.
+    """
+    await _store(hass, entry_id).async_remove()
+
+
+class BydSnapshot:
+    """Last-known realtime, HVAC and GPS models per VIN, kept in HA storage."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        coordinators: dict[str, BydDataUpdateCoordinator],
+        gps_coordinators: dict[str, BydGpsUpdateCoordinator],
+    ) -> None:
+        self._store = _store(hass, entry_id)
+        self._coordinators = coordinators
+        self._gps_coordinators = gps_coordinators
+        self._unsubs: list[Callable[[], None]] = []
+        self._save_pending = False
+
+    async def async_restore(self) -> set[str]:
+        """Seed coordinators from the stored snapshot.
+
+        Returns the VINs whose telemetry and GPS were both restored; only
+        those can skip the blocking first refresh.
+        """
+        stored = await self._store.async_load()
+        if not stored or time() - stored.get("saved_at", 0) > _MAX_AGE_S:
+            return set()
+        restored: set[str] = set()
+        for vin, raw_sections in stored.get("vehicles", {}).items():
+            coordinator = self._coordinators.get(vin)
+            gps_coordinator = self._gps_coordinators.get(vin)
+            if coordinator is None or gps_coordinator is None:
+                continue
+            sections: dict[str, Any] = {}
+            for section, raw in raw_sections.items():
+                model = _SECTION_MODELS.get(section)
+                if model is None:
+                    continue
+                try:
+                    sections[section] = model.model_validate(raw)
+                except ValidationError as exc:
+                    _LOGGER.debug(
+                        "Discarding stored %s for vin=%s: %s", section, vin[-6:], exc
+                    )
+            gps = sections.get("gps")
+            if "realtime" not in sections or gps is None:
+                continue
+            coordinator.async_restore(sections["realtime"], sections.get("hvac"))
+            gps_coordinator.async_restore(gps)
+            restored.add(vin)
+        _LOGGER.debug("Restored telemetry snapshot for %s vehicle(s)", len(restored))
+        return restored
+
+    @callback
+    def async_track(self) -> None:
+        """Save a snapshot shortly after any coordinator publishes new data."""
+        self._unsubs = [
+            coordinator.async_add_listener(self._async_schedule_save)
+            for coordinator in self._coordinators.values()
+        ] + [
+            gps_coordinator.async_add_listener(self._async_schedule_save)
+            for gps_coordinator in self._gps_coordinators.values()
+        ]
+
+    async def async_unload(self) -> None:
+        """Stop tracking and write any pending snapshot now."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        if self._save_pending:
+            # async_save also cancels the pending delayed write.
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY_S)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        # Runs at most once per _SAVE_DELAY_S, so dumping the live models
+        # on the loop is an accepted cost.
+        vehicles: dict[str, dict[str, Any]] = {}
+        for vin, coordinator in self._coordinators.items():
+            sections = vehicles[vin] = {}
+            for section in ("realtime", "hvac"):
+                model = lookup_vin_data(coordinator.data, section, vin)
+                if model is not None:
+                    sections[section] = model.model_dump(mode="json")
+            gps_coordinator = self._gps_coordinators.get(vin)
+            if gps_coordinator is not None:
+                gps = lookup_vin_data(gps_coordinator.data, "gps", vin)
+                if gps is not None:
+                    sections["gps"] = gps.model_dump(mode="json")
+        return {"saved_at": time(), "vehicles": vehicles}
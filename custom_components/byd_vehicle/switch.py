@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+from operator import methodcaller
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -11,15 +11,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
-from pybyd.models.control import (
-    BatteryHeatParams,
-    ClimateStartParams,
-    SeatClimateParams,
-)
+from pybyd.models.control import BatteryHeatParams, ClimateStartParams
 
 from .const import DOMAIN
 from .coordinator import BydApi, BydDataUpdateCoordinator
-from .entity import BydVehicleEntity
+from .entity import BydVehicleEntity, get_coordinator_vehicle
 
 
 async def async_setup_entry(
@@ -36,15 +32,17 @@ async def async_setup_entry(
     entities: list[SwitchEntity] = []
     for vin, coordinator in coordinators.items():
         gps_coordinator = gps_coordinators.get(vin)
-        vehicle = coordinator.data.get("vehicles", {}).get(vin)
+        vehicle = get_coordinator_vehicle(coordinator, vin)
         if vehicle is None:
             continue
-        entities.append(
-            BydDisablePollingSwitch(coordinator, gps_coordinator, vin, vehicle)
+        entities.extend(
+            (
+                BydDisablePollingSwitch(coordinator, gps_coordinator, vin, vehicle),
+                BydCarOnSwitch(coordinator, api, vin, vehicle),
+                BydBatteryHeatSwitch(coordinator, api, vin, vehicle),
+                BydSteeringWheelHeatSwitch(coordinator, api, vin, vehicle),
+            )
         )
-        entities.append(BydCarOnSwitch(coordinator, api, vin, vehicle))
-        entities.append(BydBatteryHeatSwitch(coordinator, api, vin, vehicle))
-        entities.append(BydSteeringWheelHeatSwitch(coordinator, api, vin, vehicle))
 
     async_add_entities(entities)
 
@@ -91,6 +89,9 @@ class BydBatteryHeatSwitch(BydVehicleEntity, SwitchEntity):
             return getattr(realtime, "battery_heat_state", None) is None
         return True
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on, self.assumed_state)
+
     def _is_command_confirmed(self) -> bool:
         """Return True when realtime data confirms the battery heat command."""
         if self._last_state is None:
@@ -105,32 +106,28 @@ class BydBatteryHeatSwitch(BydVehicleEntity, SwitchEntity):
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on battery heat."""
-
-        async def _call(client: Any) -> Any:
-            return await client.set_battery_heat(
-                self._vin, params=BatteryHeatParams(on=True)
-            )
+        call = methodcaller(
+            "set_battery_heat", self._vin, params=BatteryHeatParams(on=True)
+        )
 
         self._last_state = True
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command="battery_heat_on",
             on_rollback=lambda: setattr(self, "_last_state", None),
         )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off battery heat."""
-
-        async def _call(client: Any) -> Any:
-            return await client.set_battery_heat(
-                self._vin, params=BatteryHeatParams(on=False)
-            )
+        call = methodcaller(
+            "set_battery_heat", self._vin, params=BatteryHeatParams(on=False)
+        )
 
         self._last_state = False
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command="battery_heat_off",
             on_rollback=lambda: setattr(self, "_last_state", None),
         )
@@ -158,6 +155,7 @@ class BydCarOnSwitch(BydVehicleEntity, SwitchEntity):
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_switch_car_on"
         self._last_state: bool | None = None
+        self._extra_attrs: dict[str, Any] | None = None
 
     @property
     def is_on(self) -> bool | None:
@@ -183,21 +181,21 @@ class BydCarOnSwitch(BydVehicleEntity, SwitchEntity):
         """Return True if HVAC state is unavailable."""
         return self._get_hvac_status() is None
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on, self.assumed_state)
+
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on car-on (start climate at 21°C)."""
-
-        async def _call(client: Any) -> Any:
-            return await client.start_climate(
-                self._vin,
-                params=ClimateStartParams(
-                    temperature=self._DEFAULT_TEMP_C, time_span=1
-                ),
-            )
+        call = methodcaller(
+            "start_climate",
+            self._vin,
+            params=ClimateStartParams(temperature=self._DEFAULT_TEMP_C, time_span=1),
+        )
 
         self._last_state = True
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command="car_on",
             on_rollback=lambda: setattr(self, "_last_state", None),
         )
@@ -212,14 +210,12 @@ class BydCarOnSwitch(BydVehicleEntity, SwitchEntity):
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off car-on (stop climate)."""
-
-        async def _call(client: Any) -> Any:
-            return await client.stop_climate(self._vin)
+        call = methodcaller("stop_climate", self._vin)
 
         self._last_state = False
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command="car_off",
             on_rollback=lambda: setattr(self, "_last_state", None),
         )
@@ -245,21 +241,16 @@ class BydCarOnSwitch(BydVehicleEntity, SwitchEntity):
             return False
         return True
 
-    _DELAYED_REFRESH_SECONDS = 20
-
-    def _schedule_delayed_refresh(self) -> None:
-        """Schedule a coordinator refresh after a short delay."""
-
-        async def _delayed() -> None:
-            await asyncio.sleep(self._DELAYED_REFRESH_SECONDS)
-            await self.coordinator.async_force_refresh()
-
-        self.hass.async_create_task(_delayed())
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        return {**super().extra_state_attributes, "target_temperature_c": 21}
+        # Constant for the entity's lifetime.
+        if self._extra_attrs is None:
+            self._extra_attrs = {
+                **super().extra_state_attributes,
+                "target_temperature_c": 21,
+            }
+        return self._extra_attrs
 
 
 class BydSteeringWheelHeatSwitch(BydVehicleEntity, SwitchEntity):
@@ -315,6 +306,9 @@ class BydSteeringWheelHeatSwitch(BydVehicleEntity, SwitchEntity):
             return realtime.is_steering_wheel_heating is None
         return True
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on, self.assumed_state)
+
     def _is_command_confirmed(self) -> bool:
         """Return True when data confirms the steering wheel heat command."""
         if self._last_state is None:
@@ -335,18 +329,17 @@ class BydSteeringWheelHeatSwitch(BydVehicleEntity, SwitchEntity):
         """Send seat climate command with steering wheel heat toggled."""
         hvac = self._get_hvac_status()
         realtime = self._get_realtime()
-        params = SeatClimateParams.from_current_state(hvac, realtime).with_change(
+        params = self.coordinator.seat_climate_params(hvac, realtime).with_change(
             "steering_wheel_heat_state", 1 if on else 3
         )
 
-        async def _call(client: Any) -> Any:
-            return await client.set_seat_climate(self._vin, params=params)
+        call = methodcaller("set_seat_climate", self._vin, params=params)
 
         cmd = "steering_wheel_heat_on" if on else "steering_wheel_heat_off"
         self._last_state = on
         await self._execute_command(
             self._api,
-            _call,
+            call,
             command=cmd,
             on_rollback=lambda: setattr(self, "_last_state", None),
         )
@@ -381,6 +374,8 @@ class BydDisablePollingSwitch(BydVehicleEntity, RestoreEntity, SwitchEntity):
         self._gps_coordinator = gps_coordinator
         self._attr_unique_id = f"{vin}_switch_disable_polling"
         self._disabled = False
+        # Polling state last pushed to the coordinators.
+        self._applied: bool | None = None
 
     async def async_added_to_hass(self) -> None:
         """Restore last state on startup."""
@@ -388,32 +383,33 @@ class BydDisablePollingSwitch(BydVehicleEntity, RestoreEntity, SwitchEntity):
         last = await self.async_get_last_state()
         if last is not None:
             self._disabled = last.state == "on"
+        # HA writes the initial state once this returns.
         self._apply()
 
-    @property
-    def available(self) -> bool:
-        if not super().available:
-            return False
-        return self.coordinator.data.get("vehicles", {}).get(self._vin) is not None
-
     @property
     def is_on(self) -> bool:
         """Return True when polling is disabled."""
         return self._disabled
 
-    def _apply(self) -> None:
+    def _apply(self) -> bool:
+        """Push the polling state to the coordinators; return True if it changed."""
+        if self._applied == self._disabled:
+            return False
+        self._applied = self._disabled
         self.coordinator.set_polling_enabled(not self._disabled)
         gps = self._gps_coordinator
         if gps is not None:
             gps.set_polling_enabled(not self._disabled)
-        self.async_write_ha_state()
+        return True
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Disable polling."""
         self._disabled = True
-        self._apply()
+        if self._apply():
+            self.async_write_ha_state()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Re-enable polling."""
         self._disabled = False
-        self._apply()
+        if self._apply():
+            self.async_write_ha_state()
@@ -10,13 +10,21 @@ from pybyd.models.gps import GpsInfo
 FieldValidator = Callable[[Any, Any], Any]
 
 _GPS_NULL_ISLAND_THRESHOLD: float = 0.1
+#: Fixes within this squared distance (degrees²) of (0, 0) are treated as
+#: "Null Island" placeholders.
+_GPS_NULL_ISLAND_THRESHOLD_SQ: float = _GPS_NULL_ISLAND_THRESHOLD**2
 
 
 def keep_previous_when_zero(previous: Any, incoming: Any) -> Any:
     """Return previous value when incoming is zero, otherwise incoming."""
-    if incoming == 0 and previous is not None:
-        return previous
-    return incoming
+    if previous is None or incoming is None:
+        return incoming
+    # Telemetry values are plain ints/floats; other types take the generic
+    # (and slower) __eq__ path.
+    cls = type(incoming)
+    if cls is float or cls is int:
+        return previous if not incoming else incoming
+    return previous if incoming == 0 else incoming
 
 
 def guard_gps_coordinates(
@@ -36,11 +44,8 @@ def guard_gps_coordinates(
     lat, lon = incoming.latitude, incoming.longitude
     if lat is None and lon is None:
         return previous
-    if (
-        lat is not None
-        and lon is not None
-        and abs(lat) < _GPS_NULL_ISLAND_THRESHOLD
-        and abs(lon) < _GPS_NULL_ISLAND_THRESHOLD
-    ):
+    if lat is None or lon is None:
+        return incoming
+    if lat * lat + lon * lon < _GPS_NULL_ISLAND_THRESHOLD_SQ:
         return previous
     return incoming